@@ -1,22 +1,174 @@
 """Multi-threaded batch processing for GIF operations."""
 
+import os
+import shutil
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable, List, Optional
 from core.logger import log_info, log_warning, log_error
-from core.gifski_wrapper import create_gif_from_frames, optimize_gif
-from core.ffmpeg_wrapper import extract_frames
+from core.gifski_wrapper import (
+    build_gifski_prefix,
+    set_batch_concurrency,
+    create_gif_from_frames,
+    create_gif_from_stream,
+    optimize_gif
+)
+from core.ffmpeg_wrapper import extract_frames, extract_frames_piped
 from utils.file_utils import (
     scan_for_videos,
     scan_for_images,
-    scan_for_gifs,
+    scan_for_gifs_with_sizes,
     group_images_by_name,
     ensure_temp_folder,
-    cleanup_temp_folder,
     get_file_size_mb
 )
 
 
+def _existing_output_names(output_folder: Path, is_test: bool) -> set:
+    """Names already present in the output folder, for skip checks.
+
+    One scandir pass up front replaces a stat() per input file - the
+    per-item skip test becomes a set lookup, which is what makes
+    resuming a mostly-processed batch fast on network drives. Test mode
+    never skips, so it gets an empty set.
+
+    Args:
+        output_folder: Folder the batch writes GIFs into
+        is_test: Whether this is a test-file run
+
+    Returns:
+        Set of entry names in the output folder
+    """
+    if is_test:
+        return set()
+    try:
+        with os.scandir(output_folder) as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
+
+
+def _pool_worker_count() -> int:
+    """Number of pool workers for per-file tasks.
+
+    Half the CPU count: gifski is multi-threaded itself, so more workers
+    just causes oversubscription without improving wall time.
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _process_one_video(video_path, output_path, temp_root, settings, prefix=None,
+                       cancel_event=None):
+    """Process a single video into a GIF (pool worker task).
+
+    Extracts frames into a per-video temp subfolder so concurrent FFmpeg
+    invocations never share frame_*.png files, then hands the frames to
+    gifski. The actual CPU work happens in the ffmpeg/gifski child
+    processes, so a thread pool can run these tasks truly in parallel.
+
+    Args:
+        video_path: Video file to process
+        output_path: Output GIF path
+        temp_root: Shared temp folder (each video gets its own subfolder)
+        settings: Dictionary of gifski settings
+
+    Returns:
+        Tuple of (video_path, success, error_message, size_mb)
+    """
+    # Bail before spawning anything if the batch was cancelled while
+    # this task sat in the pool queue
+    if cancel_event is not None and cancel_event.is_set():
+        return video_path, False, "Cancelled", 0.0
+
+    keep_temp_files = settings.get('keep_temp_files', True)
+
+    # When the user doesn't need the extracted frames, skip the PNG
+    # round trip entirely: pipe ffmpeg's decoded stream straight into
+    # gifski so the two processes overlap and no temp IO happens
+    if not keep_temp_files:
+        ffmpeg_proc = extract_frames_piped(video_path, settings.get('fps'))
+        if ffmpeg_proc is not None:
+            success, error = create_gif_from_stream(ffmpeg_proc, output_path, settings, prefix)
+            if not success:
+                return video_path, False, error, 0.0
+            return video_path, True, "", get_file_size_mb(output_path)
+        # Fall through to the disk-based path if the pipe couldn't
+        # start or the source has alpha (y4m would flatten it)
+
+    # Per-video subfolder avoids frame_*.png collisions between workers
+    temp_folder = temp_root / video_path.stem
+    temp_folder.mkdir(parents=True, exist_ok=True)
+
+    # Extract frames using FFmpeg
+    success, error, frames = extract_frames(
+        video_path,
+        temp_folder,
+        settings.get('fps')
+    )
+
+    if not success or not frames:
+        return video_path, False, error or "No frames extracted", 0.0
+
+    # Cancellation point between the two subprocess spawns
+    if cancel_event is not None and cancel_event.is_set():
+        return video_path, False, "Cancelled", 0.0
+
+    # Create GIF from frames (temp cleanup is deferred to the driver,
+    # which removes the whole temp root in one pass after the batch)
+    success, error = create_gif_from_frames(frames, output_path, settings, prefix)
+
+    if not success:
+        return video_path, False, error, 0.0
+
+    return video_path, True, "", get_file_size_mb(output_path)
+
+
+def _process_one_group(base_name, image_files, output_path, settings, prefix=None,
+                       cancel_event=None):
+    """Create a GIF from one image group (pool worker task).
+
+    Args:
+        base_name: Group base name
+        image_files: Sorted list of image file paths
+        output_path: Output GIF path
+        settings: Dictionary of gifski settings
+
+    Returns:
+        Tuple of (base_name, success, error_message, size_mb)
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        return base_name, False, "Cancelled", 0.0
+
+    success, error = create_gif_from_frames(image_files, output_path, settings, prefix)
+    if not success:
+        return base_name, False, error, 0.0
+    return base_name, True, "", get_file_size_mb(output_path)
+
+
+def _optimize_one_gif(gif_path, output_path, settings, original_size, prefix=None,
+                      cancel_event=None):
+    """Optimize a single GIF (pool worker task).
+
+    Args:
+        gif_path: Input GIF path
+        output_path: Output GIF path
+        settings: Dictionary of gifski settings
+        original_size: Input size in MB, as collected by the scan (saves
+            a redundant stat per file)
+
+    Returns:
+        Tuple of (gif_path, success, error_message, original_size_mb, optimized_size_mb)
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        return gif_path, False, "Cancelled", original_size, 0.0
+
+    success, error = optimize_gif(gif_path, output_path, settings, prefix)
+    if not success:
+        return gif_path, False, error, original_size, 0.0
+    return gif_path, True, "", original_size, get_file_size_mb(output_path)
+
+
 class BatchProcessor:
     """Multi-threaded batch processor for GIF operations."""
 
@@ -38,17 +190,48 @@ class BatchProcessor:
         self.settings = settings or {}
         self.progress_callback = progress_callback
         self.log_callback = log_callback
-        self.cancel_flag = False
+        self.cancel_event = threading.Event()
         self.current_thread = None
 
+        # Settings are fixed for this processor's lifetime, so freeze
+        # the gifski CLI args (pre-stringified, pre-looked-up) here
+        # once instead of rebuilding them for every batch run
+        if mode and self.settings:
+            prefix_mode = 'optimize' if mode == 'mode3' else 'frames'
+            # Reset the module-global batch concurrency from any
+            # previous run; it sizes the per-spawn RAYON_NUM_THREADS
+            # budget, not the prefix, so single-file paths that use the
+            # frozen prefix directly get the full thread allowance
+            set_batch_concurrency(1)
+            self.gifski_prefix = build_gifski_prefix(prefix_mode, self.settings)
+        else:
+            self.gifski_prefix = None
+
+    def _gifski_prefix_for(self, prefix_mode, settings, workers=1):
+        """Return the frozen CLI prefix, rebuilding only if the caller's
+        settings differ from the ones it was built under. The worker
+        count doesn't affect the prefix - it feeds the per-spawn
+        RAYON_NUM_THREADS budget via set_batch_concurrency, so each
+        gifski process gets available_cpus // workers threads."""
+        set_batch_concurrency(workers)
+        if self.gifski_prefix is not None and settings is self.settings:
+            return self.gifski_prefix
+        self.gifski_prefix = build_gifski_prefix(prefix_mode, settings)
+        self.settings = settings
+        return self.gifski_prefix
+
     def cancel(self):
-        """Request cancellation of current processing."""
-        self.cancel_flag = True
+        """Request cancellation of current processing.
+
+        Sets the shared event, so queued and in-flight worker tasks see
+        the cancellation immediately rather than at the next loop poll.
+        """
+        self.cancel_event.set()
         log_info("Processing cancellation requested")
 
     def reset_cancel(self):
-        """Reset cancellation flag."""
-        self.cancel_flag = False
+        """Reset cancellation event."""
+        self.cancel_event.clear()
 
     def process_test_file(self):
         """Process first item only (test mode).
@@ -194,8 +377,8 @@ class BatchProcessor:
                 videos = videos[:1]
                 log_info("Test mode: processing first video only")
 
-            # Ensure temp folder exists
-            temp_folder = ensure_temp_folder(output_folder)
+            # Ensure temp folder exists (workers create per-video subfolders)
+            temp_root = ensure_temp_folder(output_folder)
 
             # Track statistics
             stats = {
@@ -205,74 +388,82 @@ class BatchProcessor:
                 'failed': 0
             }
 
-            # Process each video
-            for i, video_path in enumerate(videos):
-                if self.cancel_flag:
-                    log_info("Processing cancelled by user")
-                    break
-
-                # Determine output path
+            # Apply skip logic up front so the pool only sees real work
+            # (one output-folder scan instead of a stat per input file)
+            existing_outputs = _existing_output_names(output_folder, is_test)
+            pending = []
+            completed = 0
+            for video_path in videos:
                 if is_test:
                     output_path = output_folder / f"test_{video_path.stem}.gif"
                 else:
                     output_path = output_folder / f"{video_path.stem}.gif"
 
                 # Check skip logic (unless test mode)
-                if not is_test and output_path.exists():
+                if not is_test and output_path.name in existing_outputs:
                     log_info(f"Skipped {video_path.name} (already processed)")
                     stats['skipped'] += 1
-                    file_num = i + 1
+                    completed += 1
                     if status_callback:
-                        status_callback(f"[{file_num}/{stats['total']}] Skipped {video_path.name} (already exists)")
+                        status_callback(f"[{completed}/{stats['total']}] Skipped {video_path.name} (already exists)")
                     if progress_callback:
-                        progress_callback(i + 1, stats['total'])
+                        progress_callback(completed, stats['total'])
                     continue
 
-                # Update status
-                file_num = i + 1
-                if status_callback:
-                    status_callback(f"[{file_num}/{stats['total']}] Extracting frames from {video_path.name}...")
-
-                log_info(f"Processing video: {video_path.name}")
-
-                # Extract frames using FFmpeg
-                success, error, frames = extract_frames(
-                    video_path,
-                    temp_folder,
-                    settings.get('fps')
-                )
-
-                if not success or not frames:
-                    log_error(f"Failed to extract frames from {video_path.name}: {error}")
-                    stats['failed'] += 1
-                    cleanup_temp_folder(temp_folder)
-                    continue
-
-                # Update status - creating GIF
-                if status_callback:
-                    status_callback(f"[{file_num}/{stats['total']}] Creating GIF from {len(frames)} frames ({video_path.name})...")
-
-                # Create GIF from frames
-                success, error = create_gif_from_frames(frames, output_path, settings)
-
-                # Cleanup temp files (unless user wants to keep them)
-                keep_temp_files = settings.get('keep_temp_files', True)
-                if not keep_temp_files:
-                    cleanup_temp_folder(temp_folder)
-                else:
-                    log_info(f"Keeping extracted frames in: {temp_folder}")
-
-                if success:
-                    stats['processed'] += 1
-                    size_mb = get_file_size_mb(output_path)
-                    log_info(f"Successfully created {output_path.name} ({size_mb:.2f} MB)")
+                pending.append((video_path, output_path))
+
+            # Process videos in parallel (ffmpeg/gifski run as child
+            # processes, so worker threads scale across cores)
+            if pending:
+                max_workers = min(_pool_worker_count(), len(pending))
+                log_info(f"Processing {len(pending)} video(s) with {max_workers} worker(s)")
+
+                # Settings are identical across the batch - one frozen
+                # tuple of gifski args serves every file
+                prefix = self._gifski_prefix_for('frames', settings, max_workers)
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {}
+                    for video_path, output_path in pending:
+                        log_info(f"Processing video: {video_path.name}")
+                        future = executor.submit(
+                            _process_one_video, video_path, output_path, temp_root,
+                            settings, prefix, self.cancel_event
+                        )
+                        futures[future] = video_path
+
+                    for future in as_completed(futures):
+                        if self.cancel_event.is_set():
+                            # Drop queued tasks; running ones finish their file
+                            for f in futures:
+                                f.cancel()
+                            log_info("Processing cancelled by user")
+                            break
+
+                        video_path, success, error, size_mb = future.result()
+                        completed += 1
+
+                        if success:
+                            stats['processed'] += 1
+                            log_info(f"Successfully created {video_path.stem}.gif ({size_mb:.2f} MB)")
+                            if status_callback:
+                                status_callback(f"[{completed}/{stats['total']}] Created GIF from {video_path.name}")
+                        else:
+                            stats['failed'] += 1
+                            log_error(f"Failed to create GIF from {video_path.name}: {error}")
+                            if status_callback:
+                                status_callback(f"[{completed}/{stats['total']}] Failed {video_path.name}")
+
+                        # Update progress
+                        if progress_callback:
+                            progress_callback(completed, stats['total'])
+
+                # One deferred cleanup pass for the whole batch instead
+                # of a directory walk after every video
+                if not settings.get('keep_temp_files', True):
+                    shutil.rmtree(temp_root, ignore_errors=True)
                 else:
-                    stats['failed'] += 1
-                    log_error(f"Failed to create GIF from {video_path.name}: {error}")
-
-                # Update progress
-                if progress_callback:
-                    progress_callback(i + 1, stats['total'])
+                    log_info(f"Keeping extracted frames in: {temp_root}")
 
             return True, "", stats
 
@@ -328,53 +519,74 @@ class BatchProcessor:
                 'failed': 0
             }
 
-            # Ensure temp folder exists
-            temp_folder = ensure_temp_folder(output_folder)
-
-            # Process each group
-            for i, (base_name, image_files) in enumerate(group_items):
-                if self.cancel_flag:
-                    log_info("Processing cancelled by user")
-                    break
-
-                # Determine output path
+            # Apply skip logic up front so the pool only sees real work
+            # (one output-folder scan instead of a stat per input file)
+            existing_outputs = _existing_output_names(output_folder, is_test)
+            pending = []
+            completed = 0
+            for base_name, image_files in group_items:
                 if is_test:
                     output_path = output_folder / f"test_{base_name}.gif"
                 else:
                     output_path = output_folder / f"{base_name}.gif"
 
                 # Check skip logic (unless test mode)
-                if not is_test and output_path.exists():
+                if not is_test and output_path.name in existing_outputs:
                     log_info(f"Skipped {base_name} group (already processed)")
                     stats['skipped'] += 1
-                    file_num = i + 1
+                    completed += 1
                     if status_callback:
-                        status_callback(f"[{file_num}/{stats['total']}] Skipped {base_name} (already exists)")
+                        status_callback(f"[{completed}/{stats['total']}] Skipped {base_name} (already exists)")
                     if progress_callback:
-                        progress_callback(i + 1, stats['total'])
+                        progress_callback(completed, stats['total'])
                     continue
 
-                # Update status
-                file_num = i + 1
-                if status_callback:
-                    status_callback(f"[{file_num}/{stats['total']}] Creating GIF from {len(image_files)} images ({base_name})...")
-
-                log_info(f"Processing group: {base_name} ({len(image_files)} images)")
-
-                # Create GIF from images
-                success, error = create_gif_from_frames(image_files, output_path, settings)
-
-                if success:
-                    stats['processed'] += 1
-                    size_mb = get_file_size_mb(output_path)
-                    log_info(f"Successfully created {output_path.name} ({size_mb:.2f} MB)")
-                else:
-                    stats['failed'] += 1
-                    log_error(f"Failed to create GIF from {base_name}: {error}")
-
-                # Update progress
-                if progress_callback:
-                    progress_callback(i + 1, stats['total'])
+                pending.append((base_name, image_files, output_path))
+
+            # Process groups in parallel (gifski runs as a child process)
+            if pending:
+                max_workers = min(_pool_worker_count(), len(pending))
+                log_info(f"Processing {len(pending)} group(s) with {max_workers} worker(s)")
+
+                # Settings are identical across the batch - one frozen
+                # tuple of gifski args serves every file
+                prefix = self._gifski_prefix_for('frames', settings, max_workers)
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {}
+                    for base_name, image_files, output_path in pending:
+                        log_info(f"Processing group: {base_name} ({len(image_files)} images)")
+                        future = executor.submit(
+                            _process_one_group, base_name, image_files, output_path,
+                            settings, prefix, self.cancel_event
+                        )
+                        futures[future] = base_name
+
+                    for future in as_completed(futures):
+                        if self.cancel_event.is_set():
+                            # Drop queued tasks; running ones finish their file
+                            for f in futures:
+                                f.cancel()
+                            log_info("Processing cancelled by user")
+                            break
+
+                        base_name, success, error, size_mb = future.result()
+                        completed += 1
+
+                        if success:
+                            stats['processed'] += 1
+                            log_info(f"Successfully created {base_name}.gif ({size_mb:.2f} MB)")
+                            if status_callback:
+                                status_callback(f"[{completed}/{stats['total']}] Created {base_name}.gif")
+                        else:
+                            stats['failed'] += 1
+                            log_error(f"Failed to create GIF from {base_name}: {error}")
+                            if status_callback:
+                                status_callback(f"[{completed}/{stats['total']}] Failed {base_name}")
+
+                        # Update progress
+                        if progress_callback:
+                            progress_callback(completed, stats['total'])
 
             return True, "", stats
 
@@ -406,8 +618,8 @@ class BatchProcessor:
             Tuple of (success, error_message, statistics)
         """
         try:
-            # Scan for GIFs
-            gifs = scan_for_gifs(input_folder)
+            # Scan for GIFs (sizes come from the same directory pass)
+            gifs = scan_for_gifs_with_sizes(input_folder)
             if not gifs:
                 return False, "No GIF files found in input folder", {}
 
@@ -426,15 +638,15 @@ class BatchProcessor:
                 'optimized_size_mb': 0.0
             }
 
-            # Process each GIF
-            for i, gif_path in enumerate(gifs):
-                if self.cancel_flag:
-                    log_info("Processing cancelled by user")
-                    break
-
+            # Apply skip logic up front so the pool only sees real work
+            # (one output-folder scan instead of a stat per input file)
+            existing_outputs = _existing_output_names(output_folder, is_test)
+            quality = settings.get('quality', 90)
+            fps = settings.get('fps', 20)
+            pending = []
+            completed = 0
+            for gif_path, orig_bytes in gifs:
                 # Determine output path with quality and FPS in filename
-                quality = settings.get('quality', 90)
-                fps = settings.get('fps', 20)
                 stem = gif_path.stem  # filename without extension
 
                 if is_test:
@@ -443,44 +655,69 @@ class BatchProcessor:
                     output_path = output_folder / f"{stem}_optim_{quality}q_{fps}fps.gif"
 
                 # Check skip logic (unless test mode)
-                if not is_test and output_path.exists():
+                if not is_test and output_path.name in existing_outputs:
                     log_info(f"Skipped {gif_path.name} (already optimized)")
                     stats['skipped'] += 1
-                    file_num = i + 1
+                    completed += 1
                     if status_callback:
-                        status_callback(f"[{file_num}/{stats['total']}] Skipped {gif_path.name} (already exists)")
+                        status_callback(f"[{completed}/{stats['total']}] Skipped {gif_path.name} (already exists)")
                     if progress_callback:
-                        progress_callback(i + 1, stats['total'])
+                        progress_callback(completed, stats['total'])
                     continue
 
-                # Update status
-                file_num = i + 1
-                if status_callback:
-                    status_callback(f"[{file_num}/{stats['total']}] Optimizing {gif_path.name}...")
-
-                log_info(f"Optimizing GIF: {gif_path.name}")
-
-                # Get original size
-                original_size = get_file_size_mb(gif_path)
-                stats['original_size_mb'] += original_size
-
-                # Optimize GIF
-                success, error = optimize_gif(gif_path, output_path, settings)
-
-                if success:
-                    stats['processed'] += 1
-                    optimized_size = get_file_size_mb(output_path)
-                    stats['optimized_size_mb'] += optimized_size
-                    reduction = ((original_size - optimized_size) / original_size * 100) if original_size > 0 else 0
-                    log_info(f"Successfully optimized {output_path.name}: "
-                            f"{original_size:.2f} MB → {optimized_size:.2f} MB ({reduction:.1f}% reduction)")
-                else:
-                    stats['failed'] += 1
-                    log_error(f"Failed to optimize {gif_path.name}: {error}")
-
-                # Update progress
-                if progress_callback:
-                    progress_callback(i + 1, stats['total'])
+                pending.append((gif_path, output_path, orig_bytes / (1024 * 1024)))
+
+            # Optimize GIFs in parallel - each optimize_gif call is an
+            # independent gifski child process. Small GIFs rarely keep
+            # gifski's internal threads busy, so allow up to 4 workers
+            # regardless of the half-CPU default used by modes 1 and 2
+            if pending:
+                max_workers = min(os.cpu_count() or 2, 4, len(pending))
+                log_info(f"Optimizing {len(pending)} GIF(s) with {max_workers} worker(s)")
+
+                # Settings are identical across the batch - one frozen
+                # tuple of gifski args serves every file
+                prefix = self._gifski_prefix_for('optimize', settings, max_workers)
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {}
+                    for gif_path, output_path, original_size in pending:
+                        log_info(f"Optimizing GIF: {gif_path.name}")
+                        future = executor.submit(
+                            _optimize_one_gif, gif_path, output_path, settings,
+                            original_size, prefix, self.cancel_event
+                        )
+                        futures[future] = gif_path
+
+                    for future in as_completed(futures):
+                        if self.cancel_event.is_set():
+                            # Drop queued tasks; running ones finish their file
+                            for f in futures:
+                                f.cancel()
+                            log_info("Processing cancelled by user")
+                            break
+
+                        gif_path, success, error, original_size, optimized_size = future.result()
+                        completed += 1
+                        stats['original_size_mb'] += original_size
+
+                        if success:
+                            stats['processed'] += 1
+                            stats['optimized_size_mb'] += optimized_size
+                            reduction = ((original_size - optimized_size) / original_size * 100) if original_size > 0 else 0
+                            log_info(f"Successfully optimized {gif_path.name}: "
+                                    f"{original_size:.2f} MB → {optimized_size:.2f} MB ({reduction:.1f}% reduction)")
+                            if status_callback:
+                                status_callback(f"[{completed}/{stats['total']}] Optimized {gif_path.name}")
+                        else:
+                            stats['failed'] += 1
+                            log_error(f"Failed to optimize {gif_path.name}: {error}")
+                            if status_callback:
+                                status_callback(f"[{completed}/{stats['total']}] Failed {gif_path.name}")
+
+                        # Update progress
+                        if progress_callback:
+                            progress_callback(completed, stats['total'])
 
             return True, "", stats
 
@@ -1,7 +1,11 @@
 """Wrapper for FFmpeg operations."""
 
+import collections
+import os
 import subprocess
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 from core.logger import log_info, log_error, log_debug
@@ -13,9 +17,90 @@ else:
     CREATE_NO_WINDOW = 0
 
 
+def run_capturing_on_error(cmd, timeout, shell=False, env=None) -> tuple[int, str]:
+    """Run a command, discard stdout, keep only the tail of stderr.
+
+    ffmpeg and gifski write megabytes of progress chatter to stderr over
+    a long batch; capture_output=True would buffer and decode all of it
+    even on success. This drains stderr into a bounded ring buffer on a
+    background thread, so memory stays O(1) and the tail is still
+    available for the error message on non-zero exit.
+
+    Args:
+        cmd: Command list (or string when shell=True)
+        timeout: Seconds to wait before killing the process
+        shell: Passed through to Popen
+        env: Passed through to Popen (None inherits our environment)
+
+    Returns:
+        Tuple of (returncode, stderr_tail_text)
+
+    Raises:
+        subprocess.TimeoutExpired: If the process exceeds the timeout
+    """
+    p = subprocess.Popen(
+        cmd,
+        shell=shell,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        creationflags=CREATE_NO_WINDOW
+    )
+
+    # Keep only the last 64 KB of stderr - enough for any error message
+    tail = collections.deque(maxlen=64 * 1024)
+
+    def _drain():
+        for chunk in iter(lambda: p.stderr.read(4096), b''):
+            tail.extend(chunk)
+
+    drainer = threading.Thread(target=_drain, daemon=True)
+    drainer.start()
+
+    try:
+        returncode = p.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        p.kill()
+        raise
+
+    drainer.join()
+
+    # Report only the last few lines - splitlines also breaks on the \r
+    # progress updates ffmpeg/gifski emit, so the tail reads as a clean
+    # error message rather than one giant progress blob
+    text = bytes(tail).decode('utf-8', 'replace')
+    return returncode, '\n'.join(text.splitlines()[-64:])
+
+
+def _thread_args() -> list:
+    """ffmpeg threading hints sized against the batch worker count.
+
+    Some codecs default to a single decode thread and the filter graph
+    (fps/select) never parallelizes without an explicit count, leaving
+    cores idle. -threads 0 lets libavcodec pick its decode parallelism;
+    the filter thread count is the available CPUs divided by how many
+    batch workers run ffmpeg concurrently, so parallel instances don't
+    oversubscribe the machine.
+
+    Returns:
+        List of ffmpeg argument strings
+    """
+    # Imported here to avoid a circular import at module load time
+    from core.gifski_wrapper import _available_cpus, _batch_concurrency
+    n = max(1, _available_cpus() // max(1, _batch_concurrency))
+    return ["-threads", "0",
+            "-filter_threads", str(n),
+            "-filter_complex_threads", str(n)]
+
+
+@lru_cache(maxsize=1)
 def check_ffmpeg_available() -> tuple[bool, str]:
     """Check if FFmpeg is available in system PATH.
 
+    Cached after the first call - spawning ffmpeg just to read its
+    version is expensive (especially on Windows), and availability
+    doesn't change mid-session. Call invalidate_tool_cache() to re-probe.
+
     Returns:
         Tuple of (is_available, error_message)
     """
@@ -31,7 +116,7 @@ def check_ffmpeg_available() -> tuple[bool, str]:
         if result.returncode == 0:
             # Extract version from output
             version_line = result.stdout.split('\n')[0]
-            log_debug(f"FFmpeg available: {version_line}")
+            log_debug("FFmpeg available: %s", version_line)
             return True, ""
         else:
             return False, "FFmpeg command failed"
@@ -41,6 +126,18 @@ def check_ffmpeg_available() -> tuple[bool, str]:
         return False, f"Error checking FFmpeg: {e}"
 
 
+def invalidate_tool_cache():
+    """Forget cached tool availability results (ffmpeg and gifski).
+
+    Use after the user installs FFmpeg or changes PATH, so the next
+    availability check actually re-probes.
+    """
+    check_ffmpeg_available.cache_clear()
+    # Imported here to avoid a circular import at module load time
+    from core.gifski_wrapper import check_gifski_available
+    check_gifski_available.cache_clear()
+
+
 def get_video_info(video_path: Path) -> Optional[Dict]:
     """Get video information (duration, fps, dimensions).
 
@@ -57,7 +154,7 @@ def get_video_info(video_path: Path) -> Optional[Dict]:
                 "ffprobe",
                 "-v", "error",
                 "-select_streams", "v:0",
-                "-show_entries", "stream=width,height,r_frame_rate,duration",
+                "-show_entries", "stream=width,height,pix_fmt,r_frame_rate,duration",
                 "-of", "default=noprint_wrappers=1",
                 str(video_path)
             ],
@@ -86,54 +183,198 @@ def get_video_info(video_path: Path) -> Optional[Dict]:
         return None
 
 
+# Pixel format name fragments that indicate an alpha channel (yuva*,
+# rgba/argb/bgra/abgr, gbrap*, ya8/ya16). The y4m pipe format can't
+# carry alpha, so these sources must take the PNG extraction path.
+_ALPHA_PIX_FMT_HINTS = ('yuva', 'rgba', 'argb', 'bgra', 'abgr', 'gbrap',
+                        'ya8', 'ya16')
+
+
+def _has_alpha(pix_fmt: str) -> bool:
+    """Whether an ffprobe pixel format name carries an alpha channel."""
+    return any(hint in pix_fmt for hint in _ALPHA_PIX_FMT_HINTS)
+
+
+def _estimate_stream_frames(info: Optional[Dict], fps: Optional[float]) -> Optional[int]:
+    """Rough output frame count for a piped extraction.
+
+    Works from an already-probed info dict (duration, and native frame
+    rate when no fps override is given) so the stream consumer can size
+    its timeout like the disk path does from the real frame list.
+
+    Args:
+        info: Dict from get_video_info, or None if the probe failed
+        fps: Output frame rate override, or None for the native rate
+
+    Returns:
+        Estimated frame count, or None if the probe failed
+    """
+    if not info:
+        return None
+    try:
+        duration = float(info.get('duration', 0))
+        if fps is None:
+            num, _, den = info.get('r_frame_rate', '').partition('/')
+            fps = float(num) / float(den or 1)
+        if duration > 0 and fps > 0:
+            return int(duration * fps)
+    except (TypeError, ValueError, ZeroDivisionError):
+        pass
+    return None
+
+
+def extract_frames_piped(
+    video_path: Path,
+    fps: Optional[float] = None
+) -> Optional[subprocess.Popen]:
+    """Start FFmpeg decoding a video to a yuv4mpeg stream on stdout.
+
+    Unlike extract_frames, no PNG files ever touch disk - the returned
+    process's stdout can be connected straight to gifski's stdin so
+    decode and encode overlap instead of running back to back.
+
+    Two extra attributes are set on the returned process for the
+    consumer: frame_estimate (int or None, from ffprobe duration x
+    output fps, for timeout budgeting) and stderr_tail (callable
+    returning the last lines of ffmpeg's stderr, so a decode failure
+    isn't reduced to gifski's opaque EOF complaint).
+
+    Args:
+        video_path: Path to video file
+        fps: Optional frame rate (if None, uses video's native fps)
+
+    Returns:
+        Popen with stdout=PIPE, or None if FFmpeg could not be started
+        or the source has an alpha channel (y4m can't carry it, so the
+        caller should fall back to the PNG extraction path)
+    """
+    try:
+        # One probe serves both the alpha check and the frame estimate
+        info = get_video_info(video_path)
+        pix_fmt = (info or {}).get('pix_fmt', '')
+        if _has_alpha(pix_fmt):
+            # Piping would silently flatten the transparency; the PNG
+            # path preserves it
+            log_info(f"{video_path.name} has an alpha channel ({pix_fmt}); "
+                     "using on-disk extraction to preserve it")
+            return None
+
+        cmd = ["ffmpeg", *_thread_args(), "-i", str(video_path)]
+
+        # Set frame rate if specified
+        if fps is not None:
+            cmd.extend(["-vf", f"fps={fps}"])
+
+        # yuv4mpeg over the pipe - the streaming format gifski accepts on stdin
+        cmd.extend(["-f", "yuv4mpegpipe", "-pix_fmt", "yuv444p", "pipe:1"])
+
+        log_debug("Streaming frames from %s over pipe...", video_path.name)
+
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=CREATE_NO_WINDOW
+        )
+
+        # Drain stderr into a bounded ring buffer on a side thread so
+        # ffmpeg can't block on a full stderr pipe mid-stream
+        tail = collections.deque(maxlen=64 * 1024)
+
+        def _drain():
+            for chunk in iter(lambda: proc.stderr.read(4096), b''):
+                tail.extend(chunk)
+
+        threading.Thread(target=_drain, daemon=True).start()
+
+        def _stderr_tail():
+            text = bytes(tail).decode('utf-8', 'replace')
+            return '\n'.join(text.splitlines()[-16:])
+
+        proc.stderr_tail = _stderr_tail
+        proc.frame_estimate = _estimate_stream_frames(info, fps)
+        return proc
+    except FileNotFoundError:
+        log_error("FFmpeg not found in system PATH")
+        return None
+    except Exception as e:
+        log_error(f"Error starting FFmpeg pipe: {e}")
+        return None
+
+
 def extract_frames(
     video_path: Path,
     output_folder: Path,
-    fps: Optional[float] = None
+    fps: Optional[float] = None,
+    timestamps: Optional[list] = None
 ) -> tuple[bool, str, list]:
     """Extract frames from video using FFmpeg.
 
+    Always uses a single FFmpeg invocation per video - never call this
+    once per frame, since each call pays full process-spawn plus
+    demux/decoder-init cost. Passing `timestamps` grabs an arbitrary
+    sparse set of frames via the select filter in that same single
+    subprocess.
+
     Args:
         video_path: Path to video file
         output_folder: Folder to save frames
         fps: Optional frame rate (if None, uses video's native fps)
+        timestamps: Optional list of timestamps (seconds); if given,
+            extracts only the frames at those times (overrides fps)
 
     Returns:
-        Tuple of (success, error_message, list_of_frame_paths)
+        Tuple of (success, error_message, list_of_frame_path_strings).
+        Paths are returned as ready-to-use strings - gifski only needs
+        strings, so stringifying here once avoids re-converting a Path
+        object per frame downstream.
     """
     try:
         # Ensure output folder exists
         output_folder.mkdir(parents=True, exist_ok=True)
 
         # Build FFmpeg command
-        cmd = ["ffmpeg", "-i", str(video_path)]
-
-        # Set frame rate if specified
-        if fps is not None:
-            cmd.extend(["-vf", f"fps={fps}"])
+        cmd = ["ffmpeg", *_thread_args(), "-i", str(video_path)]
 
         # Output pattern for frames
         output_pattern = output_folder / "frame_%04d.png"
-        cmd.extend(["-frame_pts", "0", str(output_pattern)])
 
-        log_debug(f"Extracting frames from {video_path.name}...")
+        # Fastest zlib setting for the PNG encoder: the frames are
+        # throwaway intermediates that gifski re-decodes immediately, so
+        # spending CPU on tight compression here is wasted twice over
+        codec_args = ["-vcodec", "png", "-compression_level", "1"]
 
-        # Run FFmpeg
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-            creationflags=CREATE_NO_WINDOW
-        )
+        if timestamps:
+            # Select only the requested timestamps in one pass; vfr sync
+            # keeps output frame numbering dense despite the sparse select
+            select_expr = "+".join(f"eq(t\\,{t})" for t in timestamps)
+            cmd.extend(["-vf", f"select='{select_expr}'", "-vsync", "vfr",
+                        *codec_args, str(output_pattern)])
+        else:
+            # Set frame rate if specified
+            if fps is not None:
+                cmd.extend(["-vf", f"fps={fps}"])
+            cmd.extend(["-frame_pts", "0", *codec_args, str(output_pattern)])
 
-        if result.returncode == 0:
-            # Get list of extracted frames
-            frames = sorted(output_folder.glob("frame_*.png"))
+        log_debug("Extracting frames from %s...", video_path.name)
+
+        # Run FFmpeg (stderr kept only if it fails)
+        returncode, stderr_tail = run_capturing_on_error(cmd, timeout=300)  # 5 minute timeout
+
+        if returncode == 0:
+            # Get list of extracted frames - scandir avoids the per-entry
+            # stat/fnmatch overhead of glob, which adds up for videos that
+            # produce thousands of frames (is_file uses the cached d_type)
+            with os.scandir(output_folder) as it:
+                frames = sorted(
+                    e.path for e in it
+                    if e.name.startswith("frame_") and e.name.endswith(".png")
+                    and e.is_file(follow_symlinks=False)
+                )
             log_info(f"Extracted {len(frames)} frames from {video_path.name}")
             return True, "", frames
         else:
-            error = result.stderr or "Unknown error"
+            error = stderr_tail or "Unknown error"
             log_error(f"FFmpeg extraction failed: {error}")
             return False, error, []
 
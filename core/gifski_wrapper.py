@@ -1,11 +1,19 @@
 """Wrapper for gifski.exe operations."""
 
+import collections
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from core.logger import log_info, log_error, log_debug
+from core.ffmpeg_wrapper import run_capturing_on_error
 
 # Windows-specific flag to prevent console window popup
 if sys.platform == 'win32':
@@ -14,25 +22,92 @@ else:
     CREATE_NO_WINDOW = 0
 
 
+# Base path resolved once at import: PyInstaller stores its extraction
+# folder in sys._MEIPASS; in development mode files are in the root
+_BASE_PATH = Path(getattr(sys, '_MEIPASS', None) or Path(__file__).parent.parent)
+
+
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller."""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = Path(sys._MEIPASS)
-    except AttributeError:
-        # Running in development mode - now files are in root
-        base_path = Path(__file__).parent.parent
-
-    return base_path / relative_path
+    return _BASE_PATH / relative_path
 
 
 # Path to gifski.exe (relative to project root)
-GIFSKI_PATH = get_resource_path('gifski/gifski.exe')
+GIFSKI_PATH = _BASE_PATH / 'gifski' / 'gifski.exe'
+
+# Stringified once at import - every command starts with this, and
+# WindowsPath.__str__ is not free when repeated across a bulk batch
+GIFSKI_PATH_STR = str(GIFSKI_PATH)
+
+# gifski is internally multithreaded; cap each process so several can run
+# side by side in a bulk batch without oversubscribing the CPU
+GIFSKI_THREADS = 4
+
+# How many gifski processes the current batch runs side by side; the
+# per-process thread budget is divided by this (see _default_threads)
+_batch_concurrency = 1
+
+
+def set_batch_concurrency(n: int):
+    """Tell the spawn helpers how many gifski processes run at once.
+
+    Batch drivers call this with their worker count before spawning, so
+    each gifski gets available_cpus // n threads (applied via
+    RAYON_NUM_THREADS in the child environment, see _gifski_env) and
+    the processes don't oversubscribe each other.
+
+    Args:
+        n: Number of concurrent gifski processes (clamped to >= 1)
+    """
+    global _batch_concurrency
+    _batch_concurrency = max(1, n)
+
+
+def _available_cpus() -> int:
+    """CPUs actually available to this process.
+
+    sched_getaffinity respects CPU pinning/cgroup limits where the OS
+    supports it; cpu_count() is the fallback (Windows).
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 2
+
+
+def _default_threads() -> int:
+    """Per-process gifski thread budget for the current batch."""
+    return max(1, min(GIFSKI_THREADS, _available_cpus() // _batch_concurrency))
 
 
+def _gifski_env(settings: Optional[dict] = None) -> dict:
+    """Child environment for a gifski spawn with its thread pool capped.
+
+    The bundled gifski CLI has no thread-count flag, but its rayon
+    worker pool honors RAYON_NUM_THREADS, so the per-process budget is
+    passed through the environment instead of the command line. Built
+    per spawn (not per batch) so set_batch_concurrency changes take
+    effect immediately.
+
+    Args:
+        settings: Optional settings dict; a truthy 'threads' entry
+            overrides the computed budget
+
+    Returns:
+        Copy of os.environ with RAYON_NUM_THREADS set
+    """
+    env = os.environ.copy()
+    threads = (settings or {}).get('threads') or _default_threads()
+    env['RAYON_NUM_THREADS'] = str(threads)
+    return env
+
+
+@lru_cache(maxsize=1)
 def check_gifski_available() -> tuple[bool, str]:
     """Check if gifski.exe is available.
 
+    Cached after the first call so repeated probes don't re-spawn
+    gifski --version. Clear via ffmpeg_wrapper.invalidate_tool_cache().
+
     Returns:
         Tuple of (is_available, error_message)
     """
@@ -42,14 +117,14 @@ def check_gifski_available() -> tuple[bool, str]:
     try:
         # Try running gifski --version
         result = subprocess.run(
-            [str(GIFSKI_PATH), "--version"],
+            [GIFSKI_PATH_STR, "--version"],
             capture_output=True,
             text=True,
             timeout=5,
             creationflags=CREATE_NO_WINDOW
         )
         if result.returncode == 0:
-            log_debug(f"gifski available: {result.stdout.strip()}")
+            log_debug("gifski available: %s", result.stdout.strip())
             return True, ""
         else:
             return False, "gifski.exe failed to run"
@@ -57,6 +132,50 @@ def check_gifski_available() -> tuple[bool, str]:
         return False, f"Error checking gifski: {e}"
 
 
+def invalidate_gifski_cache():
+    """Forget the cached gifski availability result.
+
+    Use if gifski.exe is replaced mid-session, so the next availability
+    check actually re-probes. ffmpeg_wrapper.invalidate_tool_cache()
+    clears this together with the FFmpeg probe.
+    """
+    check_gifski_available.cache_clear()
+
+
+def build_gifski_prefix(mode: str, settings: dict) -> tuple:
+    """Build the settings portion of a gifski command once per batch.
+
+    The same settings apply to every file in a bulk run, so the str()
+    conversions and dict lookups happen here a single time; per-file
+    callers just append the output path and inputs.
+
+    Args:
+        mode: Processing mode ('video', 'frames', 'optimize')
+        settings: Dictionary of gifski settings
+
+    Returns:
+        Tuple of (gifski_path, *option_args)
+    """
+    # No thread count here: gifski has no such flag - the per-process
+    # thread budget travels in the child environment (see _gifski_env)
+    parts = [GIFSKI_PATH_STR, '--quality', str(settings['quality'])]
+
+    # Width/height (if specified)
+    if settings.get('width', 0) > 0:
+        parts.extend(['--width', str(settings['width'])])
+    if settings.get('height', 0) > 0:
+        parts.extend(['--height', str(settings['height'])])
+
+    # FPS (for video and frames modes)
+    if mode in ('video', 'frames'):
+        parts.extend(['--fps', str(settings['fps'])])
+
+    parts.extend(['--lossy-quality', str(settings['lossy_quality'])])
+    parts.extend(['--motion-quality', str(settings['motion_quality'])])
+
+    return tuple(parts)
+
+
 def build_gifski_command(
     mode: str,
     input_path: Path,
@@ -76,33 +195,15 @@ def build_gifski_command(
     Returns:
         List of command arguments
     """
-    cmd = [str(GIFSKI_PATH), '-o', str(output_path)]
-
-    # Quality (always included)
-    cmd.extend(['--quality', str(settings['quality'])])
-
-    # Width (if specified)
-    if settings.get('width', 0) > 0:
-        cmd.extend(['--width', str(settings['width'])])
-
-    # Height (if specified)
-    if settings.get('height', 0) > 0:
-        cmd.extend(['--height', str(settings['height'])])
-
-    # FPS (for video and frames modes)
-    if mode in ['video', 'frames']:
-        cmd.extend(['--fps', str(settings['fps'])])
-
-    # Lossy quality (always included)
-    cmd.extend(['--lossy-quality', str(settings['lossy_quality'])])
-
-    # Motion quality (always included)
-    cmd.extend(['--motion-quality', str(settings['motion_quality'])])
+    # Option assembly lives in build_gifski_prefix - single source of
+    # truth shared with the per-batch prefix callers
+    prefix = build_gifski_prefix(mode, settings)
+    cmd = [prefix[0], '-o', str(output_path), *prefix[1:]]
 
     # Add input files
     if mode == 'frames' and frame_files:
-        # Add frame files in order
-        cmd.extend([str(f) for f in frame_files])
+        # Add frame files in order (fspath avoids str() churn per frame)
+        cmd.extend(map(os.fspath, frame_files))
     else:
         # Add single input file
         cmd.append(str(input_path))
@@ -110,85 +211,290 @@ def build_gifski_command(
     return cmd
 
 
+def _estimate_timeout(frame_count: int) -> int:
+    """Scale the gifski timeout with the amount of work.
+
+    A flat 300s both kills legitimate long jobs (thousands of high-res
+    frames) and lets a stuck small job block its worker for 5 minutes.
+    Budget a conservative half second per frame on top of a base
+    allowance, clamped to a 30s floor and a 30 minute ceiling.
+
+    Args:
+        frame_count: Number of frames gifski will encode
+
+    Returns:
+        Timeout in seconds
+    """
+    return max(30, min(1800, 30 + frame_count // 2))
+
+
+def _dedupe_consecutive(frame_files: Sequence) -> list:
+    """Drop runs of identical consecutive frames.
+
+    Screen captures and slideshows often repeat the exact same frame;
+    each duplicate costs gifski a full palette/LZW pass for no visual
+    gain. Files are compared by size first (free), and only size-equal
+    neighbors pay for a content hash.
+
+    Args:
+        frame_files: List of frame file paths, sorted
+
+    Returns:
+        List with consecutive duplicates removed (order preserved)
+    """
+    def _digest(path):
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+    kept = []
+    prev_size = None
+    prev_digest = None
+    for frame in frame_files:
+        size = os.path.getsize(frame)
+        if size != prev_size:
+            # Different size can't be a duplicate - no hash needed
+            kept.append(frame)
+            prev_size = size
+            prev_digest = None
+            continue
+        if prev_digest is None:
+            prev_digest = _digest(kept[-1])
+        digest = _digest(frame)
+        if digest != prev_digest:
+            kept.append(frame)
+            prev_digest = digest
+
+    return kept
+
+
 def create_gif_from_frames(
-    frame_files: List[Path],
+    frame_files: Sequence,
     output_path: Path,
-    settings: dict
+    settings: dict,
+    prefix: Optional[tuple] = None,
+    dedupe: bool = False
 ) -> tuple[bool, str]:
     """Create GIF from frame files using gifski.
 
     Args:
-        frame_files: List of frame file paths (sorted)
+        frame_files: List of frame file paths, sorted (str or Path;
+            extract_frames already hands over strings so no per-frame
+            conversion happens on the hot path)
         output_path: Output GIF path
         settings: Dictionary of gifski settings
+        prefix: Optional pre-built command prefix from
+            build_gifski_prefix('frames', settings); batch callers pass
+            this to avoid rebuilding identical args for every file
+        dedupe: Drop identical consecutive frames before encoding. Off
+            by default - gifski emits uniform frame delays, so dropping
+            duplicates shortens playback time proportionally; only use
+            for inputs where that is acceptable (e.g. slideshows)
 
     Returns:
         Tuple of (success, error_message)
     """
-    temp_file = None
     try:
-        # Build base command with options (no input files yet)
-        base_cmd = [str(GIFSKI_PATH), '-o', str(output_path)]
-        base_cmd.extend(['--quality', str(settings['quality'])])
-        if settings.get('width', 0) > 0:
-            base_cmd.extend(['--width', str(settings['width'])])
-        if settings.get('height', 0) > 0:
-            base_cmd.extend(['--height', str(settings['height'])])
-        base_cmd.extend(['--fps', str(settings['fps'])])
-        base_cmd.extend(['--lossy-quality', str(settings['lossy_quality'])])
-        base_cmd.extend(['--motion-quality', str(settings['motion_quality'])])
-
-        # For many frames, use shell glob pattern to avoid command line length limit
-        # Windows has a 32,767 character limit for command lines
-        if len(frame_files) > 50:
-            # All frames should be in the same directory
-            frames_dir = frame_files[0].parent
-            # Build command string with glob pattern (requires shell=True)
-            cmd_str = f'"{GIFSKI_PATH}" -o "{output_path}"'
-            cmd_str += f' --quality {settings["quality"]}'
-            if settings.get('width', 0) > 0:
-                cmd_str += f' --width {settings["width"]}'
-            if settings.get('height', 0) > 0:
-                cmd_str += f' --height {settings["height"]}'
-            cmd_str += f' --fps {settings["fps"]}'
-            cmd_str += f' --lossy-quality {settings["lossy_quality"]}'
-            cmd_str += f' --motion-quality {settings["motion_quality"]}'
-            cmd_str += f' "{frames_dir}\\frame*.png"'
-
-            log_debug(f"Running gifski with glob pattern: {frames_dir}\\frame*.png ({len(frame_files)} frames)")
-
-            # Run with shell=True to enable glob expansion
-            result = subprocess.run(
-                cmd_str,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                creationflags=CREATE_NO_WINDOW
+        if prefix is None:
+            prefix = build_gifski_prefix('frames', settings)
+
+        if dedupe and len(frame_files) > 1:
+            deduped = _dedupe_consecutive(frame_files)
+            if len(deduped) < len(frame_files):
+                log_info(f"Dropped {len(frame_files) - len(deduped)} duplicate "
+                         f"consecutive frames for {output_path.name}")
+                frame_files = deduped
+
+        # Direct file list (os.fspath is a no-op for strings, a C fast
+        # path for Path)
+        cmd = [prefix[0], '-o', str(output_path), *prefix[1:], *map(os.fspath, frame_files)]
+
+        # Windows has a 32,767 character limit for command lines. If the
+        # frame list would blow past it, hand gifski a glob pattern as a
+        # single argument instead - gifski expands wildcards itself on
+        # Windows, so no cmd.exe fork or shell quoting is involved and
+        # CREATE_NO_WINDOW still applies.
+        if len(subprocess.list2cmdline(cmd)) > 32000:
+            # The wildcard can only stand in for the explicit list when
+            # every input actually follows the extraction naming in one
+            # folder - Mode 2 image groups have arbitrary names, and a
+            # pattern matching none (or the wrong) files would make
+            # gifski encode garbage
+            frames_dir = os.path.dirname(os.fspath(frame_files[0]))
+            globbable = all(
+                os.path.dirname(f) == frames_dir
+                and os.path.basename(f).startswith('frame_')
+                and os.path.basename(f).endswith('.png')
+                for f in map(os.fspath, frame_files)
             )
+            if not globbable:
+                error = (f"Command line too long for {len(frame_files)} input "
+                         "files, and they don't follow the frame_*.png naming "
+                         "required for the wildcard fallback")
+                log_error(error)
+                return False, error
+            pattern = os.path.join(frames_dir, 'frame_*.png')
+            cmd = [prefix[0], '-o', str(output_path), *prefix[1:], pattern]
+            log_debug("Running gifski with glob pattern: %s (%d frames)", pattern, len(frame_files))
         else:
-            # For small number of frames, use direct file list
-            cmd = base_cmd + [str(f) for f in frame_files]
-            log_debug(f"Running gifski command: {' '.join(cmd[:10])}... ({len(frame_files)} frames)")
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                creationflags=CREATE_NO_WINDOW
-            )
+            log_debug("Running gifski command: %s... (%d frames)", cmd[:10], len(frame_files))
 
-        if result.returncode == 0:
+        # Run gifski (stderr kept only if it fails)
+        timeout = _estimate_timeout(len(frame_files))
+        returncode, stderr_tail = run_capturing_on_error(
+            cmd, timeout=timeout, env=_gifski_env(settings))
+
+        if returncode == 0:
             log_info(f"Created GIF: {output_path.name}")
             return True, ""
         else:
-            error = result.stderr or "Unknown error"
+            error = stderr_tail or "Unknown error"
             log_error(f"gifski failed: {error}")
             return False, error
 
     except subprocess.TimeoutExpired:
-        error = "gifski timed out (5 minute limit)"
+        error = f"gifski timed out ({timeout} second limit)"
+        log_error(error)
+        return False, error
+    except Exception as e:
+        error = f"Error running gifski: {e}"
+        log_error(error)
+        return False, error
+
+
+def create_gifs_batch(
+    jobs: List[tuple],
+    settings: dict
+) -> List[tuple[bool, str]]:
+    """Run several gifski encodes concurrently with a bounded pool.
+
+    Each gifski process is capped at GIFSKI_THREADS internal threads, so
+    running ~cores/GIFSKI_THREADS of them side by side covers the I/O and
+    palette-generation stalls of neighboring jobs without oversubscribing
+    the CPU. Thread workers are enough here - the heavy lifting happens
+    in the gifski child processes, not in Python.
+
+    Args:
+        jobs: List of (frame_files, output_path) tuples
+        settings: Dictionary of gifski settings (shared by all jobs)
+
+    Returns:
+        List of (success, error_message) tuples, in job order
+    """
+    if not jobs:
+        return []
+
+    workers = min(len(jobs), max(1, _available_cpus() // GIFSKI_THREADS))
+    set_batch_concurrency(workers)
+    prefix = build_gifski_prefix('frames', settings)
+
+    # Hold gifski.exe open for the duration of the batch so Windows
+    # keeps its image pages cached across the repeated child launches
+    # (gifski has no daemon mode, so a fresh process per job is
+    # unavoidable - this at least makes each launch warm)
+    try:
+        exe_handle = open(GIFSKI_PATH, 'rb')
+    except OSError:
+        exe_handle = None
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(create_gif_from_frames, frame_files, output_path,
+                            settings, prefix)
+                for frame_files, output_path in jobs
+            ]
+            return [f.result() for f in futures]
+    finally:
+        if exe_handle is not None:
+            exe_handle.close()
+
+
+def create_gif_from_stream(
+    ffmpeg_proc,
+    output_path: Path,
+    settings: dict,
+    prefix: Optional[tuple] = None
+) -> tuple[bool, str]:
+    """Create GIF from an FFmpeg yuv4mpeg stream (no temp files).
+
+    Connects gifski's stdin directly to a running FFmpeg process (see
+    ffmpeg_wrapper.extract_frames_piped), so decode and encode overlap
+    and no intermediate PNGs are written to disk.
+
+    Args:
+        ffmpeg_proc: Popen from extract_frames_piped (stdout=PIPE)
+        output_path: Output GIF path
+        settings: Dictionary of gifski settings
+        prefix: Optional pre-built command prefix from
+            build_gifski_prefix('video', settings)
+
+    Returns:
+        Tuple of (success, error_message)
+    """
+    try:
+        if prefix is None:
+            prefix = build_gifski_prefix('video', settings)
+
+        # Build command with '-' input (read yuv4mpeg video from stdin)
+        cmd = [prefix[0], '-o', str(output_path), *prefix[1:], '-']
+
+        # Budget the wait like the disk path sizes it from its frame
+        # list: extract_frames_piped attaches a probe-based frame
+        # estimate; flat 5 minutes only when the probe couldn't size it
+        frame_estimate = getattr(ffmpeg_proc, 'frame_estimate', None)
+        timeout = _estimate_timeout(frame_estimate) if frame_estimate else 300
+
+        log_debug("Running gifski on piped stream -> %s", output_path.name)
+
+        gifski_proc = subprocess.Popen(
+            cmd,
+            stdin=ffmpeg_proc.stdout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=_gifski_env(settings),
+            creationflags=CREATE_NO_WINDOW
+        )
+
+        # Close our copy of the pipe so gifski sees EOF when ffmpeg exits
+        ffmpeg_proc.stdout.close()
+
+        # Drain gifski's stderr into a bounded ring buffer on a side
+        # thread (same convention as run_capturing_on_error) - over a
+        # long stream communicate() would buffer all of its progress
+        # chatter just to read the error tail
+        tail = collections.deque(maxlen=64 * 1024)
+
+        def _drain():
+            for chunk in iter(lambda: gifski_proc.stderr.read(4096), b''):
+                tail.extend(chunk)
+
+        drainer = threading.Thread(target=_drain, daemon=True)
+        drainer.start()
+
+        returncode = gifski_proc.wait(timeout=timeout)
+        drainer.join()
+        ffmpeg_proc.wait(timeout=30)
+
+        if returncode == 0:
+            log_info(f"Created GIF: {output_path.name}")
+            return True, ""
+        else:
+            text = bytes(tail).decode('utf-8', 'replace')
+            error = '\n'.join(text.splitlines()[-64:]) or "Unknown error"
+            # A broken stream usually means ffmpeg failed first; its
+            # stderr tail names the actual decode problem
+            ffmpeg_tail = getattr(ffmpeg_proc, 'stderr_tail', None)
+            if ffmpeg_tail is not None:
+                tail = ffmpeg_tail()
+                if tail:
+                    error = f"{error}\nffmpeg: {tail}"
+            log_error(f"gifski failed: {error}")
+            return False, error
+
+    except subprocess.TimeoutExpired:
+        gifski_proc.kill()
+        ffmpeg_proc.kill()
+        error = f"gifski timed out ({timeout} second limit)"
         log_error(error)
         return False, error
     except Exception as e:
@@ -223,7 +529,8 @@ def create_gif_from_video(
 def optimize_gif(
     gif_path: Path,
     output_path: Path,
-    settings: dict
+    settings: dict,
+    prefix: Optional[tuple] = None
 ) -> tuple[bool, str]:
     """Optimize existing GIF using gifski.
 
@@ -231,35 +538,61 @@ def optimize_gif(
         gif_path: Input GIF path
         output_path: Output GIF path
         settings: Dictionary of gifski settings
+        prefix: Optional pre-built command prefix from
+            build_gifski_prefix('optimize', settings)
 
     Returns:
         Tuple of (success, error_message)
     """
     try:
-        # Build command
-        cmd = build_gifski_command('optimize', gif_path, output_path, settings)
-
-        log_debug(f"Running gifski command: {' '.join(cmd)}")
-
-        # Run gifski
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-            creationflags=CREATE_NO_WINDOW
-        )
+        # Identity settings mean gifski would decode and re-encode to an
+        # equivalent GIF - short-circuit to a hardlink/copy instead of
+        # paying a full quantize+encode cycle per file
+        if (settings['quality'] == 100
+                and settings['lossy_quality'] == 100
+                and settings['motion_quality'] == 100
+                and not settings.get('width')
+                and not settings.get('height')):
+            try:
+                os.link(gif_path, output_path)
+            except OSError:
+                # Different volume or links unsupported - plain copy
+                shutil.copyfile(gif_path, output_path)
+            log_info(f"Copied GIF unchanged (identity settings): {output_path.name}")
+            return True, ""
 
-        if result.returncode == 0:
+        # Build command
+        if prefix is None:
+            prefix = build_gifski_prefix('optimize', settings)
+        cmd = [prefix[0], '-o', str(output_path), *prefix[1:], str(gif_path)]
+
+        log_debug("Running gifski command: %s", cmd)
+
+        # Size the timeout from the input's frame count (cheap header
+        # scan via Pillow); fall back to the flat 5 minutes if the file
+        # can't be probed
+        timeout = 300
+        try:
+            from PIL import Image
+            with Image.open(gif_path) as im:
+                timeout = _estimate_timeout(getattr(im, 'n_frames', 1))
+        except Exception:
+            pass
+
+        # Run gifski (stderr kept only if it fails)
+        returncode, stderr_tail = run_capturing_on_error(
+            cmd, timeout=timeout, env=_gifski_env(settings))
+
+        if returncode == 0:
             log_info(f"Optimized GIF: {output_path.name}")
             return True, ""
         else:
-            error = result.stderr or "Unknown error"
+            error = stderr_tail or "Unknown error"
             log_error(f"gifski optimization failed: {error}")
             return False, error
 
     except subprocess.TimeoutExpired:
-        error = "gifski timed out (5 minute limit)"
+        error = f"gifski timed out ({timeout} second limit)"
         log_error(error)
         return False, error
     except Exception as e:
@@ -1,83 +1,99 @@
 """Thread-safe logging system for Easy Bulk GIF Optimizer."""
 
+import atexit
 import logging
-import threading
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 import sys
 
 
 class ThreadSafeLogger:
-    """Thread-safe logger that writes to application directory."""
+    """Thread-safe logger that writes to application directory.
+
+    Records flow through a QueueHandler into a QueueListener thread that
+    owns the single FileHandler, so worker threads only do a lock-free
+    queue.put - no handler lock contention and no disk I/O on the
+    threads doing the actual encoding work. The logging module itself is
+    thread-safe, so no extra locking is needed on top.
+    """
 
     def __init__(self):
         self.logger = None
-        self.lock = threading.Lock()
+        self.listener = None
         self._initialize_default_logger()
 
     def _initialize_default_logger(self):
         """Initialize a default logger that writes to application directory."""
-        with self.lock:
-            # Determine default log location (same directory as executable/script)
-            if getattr(sys, 'frozen', False):
-                # Running as PyInstaller exe - use directory where exe is located
-                base_path = Path(sys.executable).parent
-            else:
-                # Running in development mode - files are now in root
-                base_path = Path(__file__).parent.parent
+        # Determine default log location (same directory as executable/script)
+        if getattr(sys, 'frozen', False):
+            # Running as PyInstaller exe - use directory where exe is located
+            base_path = Path(sys.executable).parent
+        else:
+            # Running in development mode - files are now in root
+            base_path = Path(__file__).parent.parent
+
+        log_file = base_path / "log.txt"
 
-            log_file = base_path / "log.txt"
+        # Create logger
+        self.logger = logging.getLogger("GIFOptimizer")
+        self.logger.setLevel(logging.DEBUG)
 
-            # Create logger
-            self.logger = logging.getLogger("GIFOptimizer")
-            self.logger.setLevel(logging.DEBUG)
+        # Remove existing handlers
+        self.logger.handlers.clear()
 
-            # Remove existing handlers
-            self.logger.handlers.clear()
+        # Create file handler (owned by the listener thread below)
+        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
 
-            # Create file handler
-            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)
+        # Create formatter: timestamp + level + message
+        formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(formatter)
 
-            # Create formatter: timestamp + level + message
-            formatter = logging.Formatter(
-                '%(asctime)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(formatter)
+        # Producers push records onto a queue; a single listener thread
+        # drains it into the file handler
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
-            # Add handler to logger
-            self.logger.addHandler(file_handler)
+        self.listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self.listener.start()
 
-            # Log session start
-            self.logger.info("=" * 80)
-            self.logger.info("Easy Bulk GIF Optimizer - Application Started")
-            self.logger.info("=" * 80)
+        # Flush remaining records when the interpreter shuts down
+        atexit.register(self.listener.stop)
+
+        # Log session start
+        self.logger.info("=" * 80)
+        self.logger.info("Easy Bulk GIF Optimizer - Application Started")
+        self.logger.info("=" * 80)
 
 
     def info(self, message: str):
         """Log info message (thread-safe)."""
-        with self.lock:
-            if self.logger:
-                self.logger.info(message)
+        if self.logger:
+            self.logger.info(message)
 
     def warning(self, message: str):
         """Log warning message (thread-safe)."""
-        with self.lock:
-            if self.logger:
-                self.logger.warning(message)
+        if self.logger:
+            self.logger.warning(message)
 
     def error(self, message: str):
         """Log error message (thread-safe)."""
-        with self.lock:
-            if self.logger:
-                self.logger.error(message)
+        if self.logger:
+            self.logger.error(message)
+
+    def debug(self, message: str, *args):
+        """Log debug message (thread-safe).
 
-    def debug(self, message: str):
-        """Log debug message (thread-safe)."""
-        with self.lock:
-            if self.logger:
-                self.logger.debug(message)
+        Accepts lazy %-style args like the stdlib logger, so callers can
+        pass raw values and skip building the formatted string up front.
+        """
+        if self.logger:
+            self.logger.debug(message, *args)
 
 
 # Global logger instance
@@ -99,6 +115,6 @@ def log_error(message: str):
     _logger.error(message)
 
 
-def log_debug(message: str):
-    """Log debug message."""
-    _logger.debug(message)
+def log_debug(message: str, *args):
+    """Log debug message (supports lazy %-style args)."""
+    _logger.debug(message, *args)
@@ -4,14 +4,17 @@ Provides unified interface for all three modes.
 """
 
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.tooltip import ToolTip
 from pathlib import Path
+import functools
+import queue
 import threading
+import time
 import webbrowser
 import ctypes
+import os
 import platform
 import sys
 
@@ -22,19 +25,109 @@ from core.ffmpeg_wrapper import check_ffmpeg_available
 from core.logger import log_info
 from utils.validators import validate_quality, validate_dimension, validate_fps
 from utils.config import Config
-from utils.file_utils import scan_all_file_types
+from utils.file_utils import scan_all_file_types, invalidate_scan_cache
+
+
+# Base path resolved once at import: PyInstaller stores its extraction
+# folder in sys._MEIPASS; in development mode files are in the root
+_BASE_PATH = Path(getattr(sys, '_MEIPASS', None) or Path(__file__).parent.parent)
 
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller."""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = Path(sys._MEIPASS)
-    except AttributeError:
-        # Running in development mode - now files are in root
-        base_path = Path(__file__).parent.parent
+    return _BASE_PATH / relative_path
+
+
+# Mode metadata: (value, radio button text, tooltip description).
+# Module-level so neither the UI build nor mode changes re-allocate it.
+_MODES = (
+    ("mode1", "Mode 1: Video → GIF (Bulk)", "Convert all videos in a folder to GIFs"),
+    ("mode2", "Mode 2: Images → GIF (Bulk with Smart Grouping)", "Convert image sequences to animated GIFs"),
+    ("mode3", "Mode 3: Optimize GIF (Bulk)", "Re-encode GIFs for better compression"),
+)
 
-    return base_path / relative_path
+# Short names for status messages (radio text minus the bulk suffix)
+_MODE_NAMES = {value: text.split(" (")[0] for value, text, _ in _MODES}
+
+
+class SharedToolTip:
+    """One tooltip popup shared by every registered widget.
+
+    ttkbootstrap's ToolTip sets up its own state and several bindings
+    per widget; with a few dozen tooltipped widgets that binding setup
+    is a measurable slice of startup. This manager keeps a single
+    hidden Toplevel plus a text dict keyed by widget path, and each
+    widget only pays for <Enter>/<Leave> bindings.
+    """
+
+    def __init__(self, root, delay=300):
+        self.root = root
+        self.delay = delay  # ms before the tip appears
+        self._texts = {}
+        self._after_id = None
+        self._tip = None
+        self._label = None
+
+    def register(self, widget, text):
+        """Attach tooltip text to a widget."""
+        self._texts[str(widget)] = text
+        widget.bind("<Enter>", self._on_enter, add="+")
+        widget.bind("<Leave>", self._on_leave, add="+")
+        widget.bind("<ButtonPress>", self._on_leave, add="+")
+
+    def register_tag(self, text_widget, tag, text):
+        """Attach tooltip text to a tag range inside a Text widget.
+
+        Lets several tooltipped "links" share one Text widget instead
+        of needing a separate Label each.
+        """
+        key = f"{text_widget}.{tag}"
+        self._texts[key] = text
+        text_widget.tag_bind(tag, "<Enter>",
+                             lambda e: self._schedule(text_widget, key), add="+")
+        text_widget.tag_bind(tag, "<Leave>", self._on_leave, add="+")
+        text_widget.tag_bind(tag, "<ButtonPress>", self._on_leave, add="+")
+
+    def _on_enter(self, event):
+        widget = event.widget
+        self._schedule(widget, str(widget))
+
+    def _schedule(self, widget, key):
+        self._cancel()
+        self._after_id = self.root.after(self.delay, lambda: self._show(widget, key))
+
+    def _on_leave(self, event):
+        self._cancel()
+        if self._tip is not None:
+            self._tip.wm_withdraw()
+
+    def _cancel(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _show(self, widget, key):
+        self._after_id = None
+        text = self._texts.get(key)
+        if not text:
+            return
+        if self._tip is None:
+            # Built on first use - most sessions never hover long enough
+            self._tip = tk.Toplevel(self.root)
+            self._tip.wm_withdraw()
+            self._tip.wm_overrideredirect(True)
+            self._label = ttk.Label(self._tip,
+                                    text='',
+                                    justify=LEFT,
+                                    padding=6,
+                                    wraplength=300,
+                                    bootstyle=(INFO, INVERSE))
+            self._label.pack()
+        self._label.configure(text=text)
+        self._tip.wm_geometry(f"+{widget.winfo_pointerx() + 12}"
+                              f"+{widget.winfo_pointery() + 12}")
+        self._tip.wm_deiconify()
+        self._tip.lift()
 
 
 class MainWindow:
@@ -65,23 +158,13 @@ class MainWindow:
         if icon_path.exists():
             self.root.iconbitmap(str(icon_path))
 
-        # Set dark title bar on Windows (must happen after window is visible)
+        # Set dark title bar on Windows. Triggered by the <Map> event so
+        # it runs exactly when the window becomes visible - no timer
+        # guesswork, and the hwnd is derived from our own window instead
+        # of GetForegroundWindow (which is wrong if the user switched
+        # apps during startup)
         if platform.system() == 'Windows':
-            def set_dark_titlebar():
-                try:
-                    # Windows 10/11 dark title bar
-                    hwnd = ctypes.windll.user32.GetForegroundWindow()
-                    DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-                    value = ctypes.c_int(1)
-                    ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                        hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
-                        ctypes.byref(value), ctypes.sizeof(value)
-                    )
-                except:
-                    pass  # Silently fail on older Windows versions
-
-            # Apply after window is visible
-            self.root.after(100, set_dark_titlebar)
+            self.root.bind("<Map>", self._apply_dark_titlebar, add='+')
 
         # Initialize config manager
         self.config = Config()
@@ -110,6 +193,37 @@ class MainWindow:
         self.should_cancel = False
         self.batch_processor = None
 
+        # Pending debounced settings-save (see _schedule_save)
+        self._save_after_id = None
+
+        # Settings writes happen on a single background thread; UI
+        # callbacks only enqueue the latest settings dict, so the Tk
+        # event loop never blocks on disk I/O
+        self._save_queue = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+
+        # Single shared tooltip popup for all widgets
+        self._tooltip = SharedToolTip(root)
+
+        # Slider (variable, value label) pairs keyed by the variable's
+        # Tcl name (see _create_slider / _update_value_labels)
+        self._value_labels = {}
+
+        # Short-TTL folder existence cache (see _folder_exists)
+        self._exists_cache = {}
+
+        # Monotonic id for background folder scans; only the result
+        # matching the latest id updates the file count label
+        self._scan_request_id = 0
+
+        # Timestamp of the last progress update pushed to Tk (see
+        # _on_progress rate limiting)
+        self._last_progress_ts = 0.0
+
+        # Shadow copy of the status label text, so worker threads can
+        # drop duplicate status messages without a cross-thread cget
+        self._current_status = ""
+
         # Build UI first (widgets must exist before loading settings)
         self._build_ui()
 
@@ -119,6 +233,24 @@ class MainWindow:
         # Check for gifski on startup
         self._check_dependencies()
 
+    def _apply_dark_titlebar(self, event=None):
+        """Apply the Windows 10/11 dark title bar to this window.
+
+        Runs once on the first <Map> event, then unbinds itself.
+        """
+        self.root.unbind("<Map>")
+        try:
+            # The Tk frame's parent is the actual top-level window
+            hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+            value = ctypes.c_int(1)
+            ctypes.windll.dwmapi.DwmSetWindowAttribute(
+                hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
+                ctypes.byref(value), ctypes.sizeof(value)
+            )
+        except:
+            pass  # Silently fail on older Windows versions
+
     def _build_ui(self):
         """Build the complete user interface."""
         # Create main container frame
@@ -132,17 +264,40 @@ class MainWindow:
         # Create scrollable frame with fixed width to account for scrollbar
         scrollable_frame = ttk.Frame(canvas, padding=20)
 
-        # Configure canvas
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scrollregion lazily: a window resize fires a storm
+        # of nested <Configure> events, and bbox("all") walks every child
+        # item. Coalesce to one recompute per idle cycle and skip the
+        # configure call entirely when the bbox hasn't changed.
+        self._last_scrollregion = None
+        self._scrollregion_pending = False
+
+        def _recompute_scrollregion():
+            self._scrollregion_pending = False
+            bbox = canvas.bbox("all")
+            if bbox != self._last_scrollregion:
+                self._last_scrollregion = bbox
+                canvas.configure(scrollregion=bbox)
+
+        def _on_frame_configure(event):
+            if not self._scrollregion_pending:
+                self._scrollregion_pending = True
+                canvas.after_idle(_recompute_scrollregion)
+
+        scrollable_frame.bind("<Configure>", _on_frame_configure)
 
         # Create window with width that accounts for scrollbar
         canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor=tk.NW)
 
         # Update the canvas window width when canvas is resized
+        self._canvas_window_width = -1
+
         def _configure_canvas(event):
+            # Each itemconfig forces a full reflow of scrollable_frame,
+            # and Tk can deliver several <Configure> events per drag
+            # frame - only resubmit when the width actually changed
+            if event.width == self._canvas_window_width:
+                return
+            self._canvas_window_width = event.width
             # Set the width of the scrollable_frame to match canvas width
             canvas.itemconfig(canvas_window, width=event.width)
 
@@ -153,11 +308,29 @@ class MainWindow:
         scrollbar.pack(side=RIGHT, fill=Y)
         canvas.pack(side=LEFT, fill=BOTH, expand=YES)
 
-        # Enable mousewheel scrolling
+        # Enable mousewheel scrolling. The wheel bindings are installed
+        # only while the pointer is over the canvas (and removed on
+        # leave), so wheel events elsewhere - e.g. over a slider - don't
+        # route through the scroller
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def _on_wheel_linux(event):
+            # X11 reports the wheel as Button-4 (up) / Button-5 (down)
+            canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+
+        def _bind_wheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            canvas.bind_all("<Button-4>", _on_wheel_linux)
+            canvas.bind_all("<Button-5>", _on_wheel_linux)
+
+        def _unbind_wheel(event):
+            canvas.unbind_all("<MouseWheel>")
+            canvas.unbind_all("<Button-4>")
+            canvas.unbind_all("<Button-5>")
+
+        canvas.bind("<Enter>", _bind_wheel)
+        canvas.bind("<Leave>", _unbind_wheel)
 
         # Use scrollable_frame as the main container
         main_frame = scrollable_frame
@@ -195,9 +368,8 @@ class MainWindow:
                                     command=self._on_help,
                                     width=8)
         self.help_btn.pack(side=RIGHT, anchor=NE)
-        ToolTip(self.help_btn,
-               text="Open user documentation",
-               bootstyle=INFO)
+        self._tooltip.register(self.help_btn,
+               text="Open user documentation")
 
         # Configure the help button to be larger and bold
         self.help_btn.configure(style='Large.Violet.TButton')
@@ -217,20 +389,14 @@ class MainWindow:
         mode_frame = ttk.LabelFrame(parent, text="Select Mode", padding=15)
         mode_frame.pack(fill=X, pady=(0, 15))
 
-        modes = [
-            ("mode1", "Mode 1: Video → GIF (Bulk)", "Convert all videos in a folder to GIFs"),
-            ("mode2", "Mode 2: Images → GIF (Bulk with Smart Grouping)", "Convert image sequences to animated GIFs"),
-            ("mode3", "Mode 3: Optimize GIF (Bulk)", "Re-encode GIFs for better compression")
-        ]
-
-        for value, text, description in modes:
+        for value, text, description in _MODES:
             rb = ttk.Radiobutton(mode_frame,
                                 text=text,
                                 variable=self.selected_mode,
                                 value=value,
                                 command=self._on_mode_changed)
             rb.pack(anchor=W, pady=5)
-            ToolTip(rb, text=description, bootstyle=INFO)
+            self._tooltip.register(rb, text=description)
 
     def _build_folder_selection(self, parent):
         """Build input and output folder selection."""
@@ -245,21 +411,21 @@ class MainWindow:
 
         input_entry = ttk.Entry(input_row, textvariable=self.input_folder)
         input_entry.pack(side=LEFT, fill=X, expand=YES, padx=5)
-        ToolTip(input_entry, text="Folder containing files to process", bootstyle=INFO)
+        self._tooltip.register(input_entry, text="Folder containing files to process")
 
         browse_input_btn = ttk.Button(input_row,
                                       text="Browse",
                                       command=self._browse_input_folder,
                                       width=10)
         browse_input_btn.pack(side=LEFT, padx=(0, 5))
-        ToolTip(browse_input_btn, text="Select input folder", bootstyle=INFO)
+        self._tooltip.register(browse_input_btn, text="Select input folder")
 
         open_input_btn = ttk.Button(input_row,
                                     text="Open",
                                     command=self._open_input_folder,
                                     width=8)
         open_input_btn.pack(side=LEFT)
-        ToolTip(open_input_btn, text="Open input folder in file explorer", bootstyle=INFO)
+        self._tooltip.register(open_input_btn, text="Open input folder in file explorer")
 
         # Output folder
         output_row = ttk.Frame(folder_frame)
@@ -269,21 +435,21 @@ class MainWindow:
 
         output_entry = ttk.Entry(output_row, textvariable=self.output_folder)
         output_entry.pack(side=LEFT, fill=X, expand=YES, padx=5)
-        ToolTip(output_entry, text="Folder where GIFs will be saved", bootstyle=INFO)
+        self._tooltip.register(output_entry, text="Folder where GIFs will be saved")
 
         browse_output_btn = ttk.Button(output_row,
                                        text="Browse",
                                        command=self._browse_output_folder,
                                        width=10)
         browse_output_btn.pack(side=LEFT, padx=(0, 5))
-        ToolTip(browse_output_btn, text="Select output folder", bootstyle=INFO)
+        self._tooltip.register(browse_output_btn, text="Select output folder")
 
         open_output_btn = ttk.Button(output_row,
                                      text="Open",
                                      command=self._open_output_folder,
                                      width=8)
         open_output_btn.pack(side=LEFT)
-        ToolTip(open_output_btn, text="Open output folder to view results", bootstyle=INFO)
+        self._tooltip.register(open_output_btn, text="Open output folder to view results")
 
         # File count display label and keep temp files checkbox
         file_count_frame = ttk.Frame(folder_frame)
@@ -295,64 +461,86 @@ class MainWindow:
                                           foreground='#888888')
         self.file_count_label.pack(side=LEFT, anchor=W)
 
-        # Vertical divider
-        divider = ttk.Separator(file_count_frame, orient=VERTICAL)
-        divider.pack(side=LEFT, fill=Y, padx=15)
+        # Vertical divider (shown together with the Mode 1 checkbox);
+        # a thin frame strip, not a ttk.Separator - the Separator's
+        # tiled 1px image makes resizes laggy
+        self._keep_temp_divider = ttk.Frame(file_count_frame, width=2,
+                                            style='Divider.TFrame')
 
-        # Keep temp files checkbox (Mode 1 only)
+        # Keep temp files checkbox (Mode 1 only - packed/unpacked on
+        # mode change, see _update_mode_widgets)
         self.keep_temp_checkbox = ttk.Checkbutton(
             file_count_frame,
             text="Keep extracted video frame images (Mode 1)",
             variable=self.keep_temp_files,
             command=self._on_keep_temp_files_changed
         )
-        self.keep_temp_checkbox.pack(side=LEFT, anchor=W)
-        ToolTip(self.keep_temp_checkbox,
+        self._tooltip.register(self.keep_temp_checkbox,
                text="When enabled, extracted video frame images are saved in the output's temp subfolder. "
-                    "Useful if you want individual images from each frame of your video. Only applies to Mode 1 (Video → GIF).",
-               bootstyle=INFO)
+                    "Useful if you want individual images from each frame of your video. Only applies to Mode 1 (Video → GIF).")
+
+        self._update_mode_widgets(self.selected_mode.get())
+
+    def _update_mode_widgets(self, mode):
+        """Show or hide widgets that only apply to the given mode.
+
+        The keep-temp-files option is meaningful for Mode 1 only;
+        leaving it visible in the other modes just adds widget and
+        layout cost and suggests a setting that has no effect.
+        """
+        if mode == "mode1":
+            self._keep_temp_divider.pack(side=LEFT, fill=Y, padx=15)
+            self.keep_temp_checkbox.pack(side=LEFT, anchor=W)
+        else:
+            self._keep_temp_divider.pack_forget()
+            self.keep_temp_checkbox.pack_forget()
 
     def _build_settings_panel(self, parent):
         """Build gifski settings panel with sliders."""
         settings_frame = ttk.LabelFrame(parent, text="Gifski Settings", padding=15)
         settings_frame.pack(fill=X, pady=(0, 15))
 
-        # Create 2 columns for settings with divider
-        left_col = ttk.Frame(settings_frame)
-        left_col.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0, 10))
-
-        # Vertical divider between columns
-        divider = ttk.Separator(settings_frame, orient=VERTICAL)
-        divider.pack(side=LEFT, fill=Y, padx=10)
+        # One gridded frame instead of nested column/row frames - the
+        # old layout spent ~20 container widgets on 6 sliders, and every
+        # extra frame costs geometry-manager work on each resize.
+        # Columns: 0-1 left sliders (label/value), 2 divider, 3-4 right
+        settings_frame.columnconfigure(0, weight=1)
+        settings_frame.columnconfigure(3, weight=1)
 
-        right_col = ttk.Frame(settings_frame)
-        right_col.pack(side=LEFT, fill=BOTH, expand=YES, padx=(10, 0))
+        # Vertical divider between columns (thin frame strip)
+        divider = ttk.Frame(settings_frame, width=2, style='Divider.TFrame')
+        divider.grid(row=0, column=2, rowspan=6, sticky=NS, padx=20)
 
         # Left column settings (increments of 5 for quality, 20 for dimensions)
-        self._create_slider(left_col, "Quality (1-100):", self.quality, 1, 100, 5,
+        self._create_slider(settings_frame, 0, 0, "Quality (1-100):", self.quality, 1, 100, 5,
                           "Overall GIF quality. Higher = better quality, larger file size")
 
-        self._create_slider(left_col, "Width (pixels, 0=original):", self.width, 0, 2000, 20,
+        self._create_slider(settings_frame, 2, 0, "Width (pixels, 0=original):", self.width, 0, 2000, 20,
                           "Output width in pixels. 0 keeps original width")
 
-        self._create_slider(left_col, "Height (pixels, 0=original):", self.height, 0, 2000, 20,
+        self._create_slider(settings_frame, 4, 0, "Height (pixels, 0=original):", self.height, 0, 2000, 20,
                           "Output height in pixels. 0 keeps original height")
 
         # Right column settings (increments of 5 for quality, FPS)
-        self._create_slider(right_col, "FPS (5-60):", self.fps, 5, 60, 5,
+        self._create_slider(settings_frame, 0, 3, "FPS (5-60):", self.fps, 5, 60, 5,
                           "Frames per second. Higher = smoother, larger file size")
 
-        self._create_slider(right_col, "Lossy Quality (1-100):", self.lossy_quality, 1, 100, 5,
+        self._create_slider(settings_frame, 2, 3, "Lossy Quality (1-100):", self.lossy_quality, 1, 100, 5,
                           "Compression level. Lower = smaller files, less quality")
 
-        self._create_slider(right_col, "Motion Quality (1-100):", self.motion_quality, 1, 100, 5,
+        self._create_slider(settings_frame, 4, 3, "Motion Quality (1-100):", self.motion_quality, 1, 100, 5,
                           "Motion handling quality. Higher = better motion, larger files")
 
-    def _create_slider(self, parent, label_text, variable, from_, to, increment, tooltip):
+    def _create_slider(self, parent, row, column, label_text, variable, from_, to, increment, tooltip):
         """Create a labeled slider with value display, tooltip, and step increments.
 
+        Grids the label, value display and slider straight into the
+        parent (two grid rows per slider) - no wrapper frames.
+
         Args:
-            parent: Parent widget
+            parent: Parent widget (gridded)
+            row: Grid row for the label row (slider goes on row + 1)
+            column: Grid column for the label (value goes on column + 1)
             label_text: Label text for the slider
             variable: tkinter variable to bind to
             from_: Minimum value
@@ -360,55 +548,49 @@ class MainWindow:
             increment: Step size for slider (e.g., 5 or 20)
             tooltip: Tooltip text
         """
-        frame = ttk.Frame(parent)
-        frame.pack(fill=X, pady=(0, 10))
-
-        # Label and value display
-        label_row = ttk.Frame(frame)
-        label_row.pack(fill=X)
-
-        label = ttk.Label(label_row, text=label_text)
-        label.pack(side=LEFT)
+        label = ttk.Label(parent, text=label_text)
+        label.grid(row=row, column=column, sticky=W)
 
         # Fixed-width value label to prevent layout shifts
-        value_label = ttk.Label(label_row,
+        value_label = ttk.Label(parent,
                                text=str(variable.get()),
                                foreground='#9C27B0',  # Violet
                                font=('Segoe UI', 10, 'bold'),
                                width=5,  # Fixed width for up to 4 digits
                                anchor=E)  # Right-align text
-        value_label.pack(side=RIGHT)
-
-        # Store reference to value label for reset functionality
-        if not hasattr(self, '_value_labels'):
-            self._value_labels = []
-        self._value_labels.append((variable, value_label))
-
-        # Callback to snap to increments and update label
-        def on_slider_change(v):
-            value = int(float(v))
-            # Snap to nearest increment
-            snapped = round(value / increment) * increment
-            # Clamp to valid range
-            snapped = max(from_, min(to, snapped))
-            variable.set(snapped)
-            value_label.config(text=str(snapped))
-            # Auto-save settings when changed
-            self._save_settings()
-
-        # Slider
-        slider = ttk.Scale(frame,
+        value_label.grid(row=row, column=column + 1, sticky=E)
+
+        # Store reference to value label for reset functionality.
+        # Keyed by the variable's Tcl name - tkinter Variables define
+        # __eq__ without __hash__, so they can't be dict keys themselves
+        self._value_labels[str(variable)] = (variable, value_label)
+
+        # Cheap label refresh through a variable trace - no per-motion
+        # command= round trip with a stringified float to parse
+        variable.trace_add(
+            'write',
+            lambda *_: value_label.config(text=str(variable.get())))
+
+        # Slider (no command= callback; the heavy snap+save path runs
+        # once per drag on button release instead of per motion event)
+        slider = ttk.Scale(parent,
                           from_=from_,
                           to=to,
                           variable=variable,
                           orient=HORIZONTAL,
-                          style='Violet.Horizontal.TScale',
-                          command=on_slider_change)
-        slider.pack(fill=X, pady=(5, 0))
+                          style='Violet.Horizontal.TScale')
+        slider.grid(row=row + 1, column=column, columnspan=2,
+                    sticky=EW, pady=(5, 10))
+        slider.bind("<ButtonRelease-1>",
+                    lambda e: self._snap_and_save(variable, from_, to, increment))
+        # Arrow keys move a focused scale without any button event, so
+        # keyboard changes need their own snap+save trigger
+        slider.bind("<KeyRelease>",
+                    lambda e: self._snap_and_save(variable, from_, to, increment))
 
         # Tooltip
-        ToolTip(label, text=tooltip, bootstyle=INFO)
-        ToolTip(slider, text=tooltip, bootstyle=INFO)
+        self._tooltip.register(label, text=tooltip)
+        self._tooltip.register(slider, text=tooltip)
 
     def _build_progress_section(self, parent):
         """Build progress section with status label and dual progress indicators."""
@@ -450,9 +632,8 @@ class MainWindow:
                                    command=self._on_generate_test,
                                    width=18)
         self.test_btn.pack(side=LEFT, padx=(0, 8))
-        ToolTip(self.test_btn,
-               text="Process first item only to preview results",
-               bootstyle=INFO)
+        self._tooltip.register(self.test_btn,
+               text="Process first item only to preview results")
 
         # Process all button (orange)
         self.process_btn = ttk.Button(button_frame,
@@ -461,9 +642,8 @@ class MainWindow:
                                       command=self._on_process_all,
                                       width=18)
         self.process_btn.pack(side=LEFT, padx=(0, 8))
-        ToolTip(self.process_btn,
-               text="Process all files in input folder (skips already processed)",
-               bootstyle=INFO)
+        self._tooltip.register(self.process_btn,
+               text="Process all files in input folder (skips already processed)")
 
         # Cancel button (red)
         self.cancel_btn = ttk.Button(button_frame,
@@ -473,9 +653,8 @@ class MainWindow:
                                      width=12,
                                      state=DISABLED)
         self.cancel_btn.pack(side=LEFT, padx=(0, 8))
-        ToolTip(self.cancel_btn,
-               text="Stop processing",
-               bootstyle=INFO)
+        self._tooltip.register(self.cancel_btn,
+               text="Stop processing")
 
         # Reset to defaults button (violet)
         self.reset_btn = ttk.Button(button_frame,
@@ -484,54 +663,69 @@ class MainWindow:
                                      command=self._reset_to_defaults,
                                      width=18)
         self.reset_btn.pack(side=LEFT)
-        ToolTip(self.reset_btn,
-               text="Reset all settings to default values (Quality: 70, Width: 320, Height: 0, FPS: 20, Lossy: 80, Motion: 80)",
-               bootstyle=INFO)
+        self._tooltip.register(self.reset_btn,
+               text="Reset all settings to default values (Quality: 70, Width: 320, Height: 0, FPS: 20, Lossy: 80, Motion: 80)")
 
     def _build_footer(self, parent):
         """Build footer with credits and links."""
         footer_frame = ttk.Frame(parent)
         footer_frame.pack(fill=X, pady=(10, 0))
 
-        # Separator
-        separator = ttk.Separator(footer_frame, orient=HORIZONTAL)
+        # Separator (thin frame strip)
+        separator = ttk.Frame(footer_frame, height=2, style='Divider.TFrame')
         separator.pack(fill=X, pady=(0, 10))
 
-        # Credits
-        credits_text = "Created by "
-        credits = ttk.Label(footer_frame, text=credits_text)
-        credits.pack(side=LEFT)
-
-        # Reactorcore link
-        reactorcore_link = ttk.Label(footer_frame,
-                                     text="Reactorcore",
-                                     foreground='#9C27B0',  # Violet
-                                     cursor='hand2')
-        reactorcore_link.pack(side=LEFT)
-        reactorcore_link.bind('<Button-1>',
-                             lambda e: webbrowser.open('https://github.com/ReactorcoreGames'))
-        ToolTip(reactorcore_link, text="Visit Reactorcore Games on GitHub", bootstyle=INFO)
-
-        # Separator
-        ttk.Label(footer_frame, text=" • ").pack(side=LEFT)
-
-        # Powered by text
-        ttk.Label(footer_frame, text="Powered by ").pack(side=LEFT)
-
-        # Gifski link
-        gifski_link = ttk.Label(footer_frame,
-                               text="Gifski",
-                               foreground='#FF8C00',  # Orange
-                               cursor='hand2')
-        gifski_link.pack(side=LEFT)
-        gifski_link.bind('<Button-1>',
-                        lambda e: webbrowser.open('https://gif.ski/'))
-        ToolTip(gifski_link, text="Visit Gifski website", bootstyle=INFO)
+        # All credit text lives in one disabled Text widget - each
+        # ttk.Label is a full Tk widget with its own style lookup, so
+        # the previous five-Label row cost five widgets where tagged
+        # character runs in a single peer do the same job
+        footer = tk.Text(footer_frame, height=1, borderwidth=0,
+                         highlightthickness=0,
+                         background='#0d0d0d', foreground='#ffffff',
+                         font=('Segoe UI', 10), takefocus=0)
+        footer.pack(side=LEFT)
+
+        footer.tag_configure('reactorcore', foreground='#9C27B0')  # Violet
+        footer.tag_configure('gifski', foreground='#FF8C00')       # Orange
+
+        footer.insert(END, "Created by ")
+        footer.insert(END, "Reactorcore", 'reactorcore')
+        footer.insert(END, " • Powered by ")
+        footer.insert(END, "Gifski", 'gifski')
+        footer.configure(state='disabled')  # read-only, no insert cursor
+
+        def _bind_link(tag, url, tooltip):
+            footer.tag_bind(tag, '<Button-1>', lambda e: webbrowser.open(url))
+            # Per-tag cursor: the Text only shows hand2 while hovering a link
+            footer.tag_bind(tag, '<Enter>',
+                            lambda e: footer.configure(cursor='hand2'), add='+')
+            footer.tag_bind(tag, '<Leave>',
+                            lambda e: footer.configure(cursor=''), add='+')
+            self._tooltip.register_tag(footer, tag, tooltip)
+
+        _bind_link('reactorcore', 'https://github.com/ReactorcoreGames',
+                   "Visit Reactorcore Games on GitHub")
+        _bind_link('gifski', 'https://gif.ski/', "Visit Gifski website")
 
     def _check_dependencies(self):
-        """Check for required dependencies on startup."""
-        # Check gifski
-        if not check_gifski_available():
+        """Check for required dependencies without blocking startup.
+
+        Both probes spawn a subprocess, so they run on a background
+        thread and the result is applied via root.after - the window
+        paints immediately instead of waiting on two process launches.
+        Probing ffmpeg here also warms its cached availability check,
+        so the Mode 1 check in _on_mode_changed is instant later.
+        """
+        def probe():
+            gifski_ok, _ = check_gifski_available()
+            check_ffmpeg_available()
+            self.root.after(0, lambda: self._apply_dependency_results(gifski_ok))
+
+        threading.Thread(target=probe, daemon=True).start()
+
+    def _apply_dependency_results(self, gifski_ok):
+        """Apply dependency probe results on the Tk thread."""
+        if not gifski_ok:
             self._show_error("gifski.exe not found!\n\n"
                            "Please ensure gifski.exe is in the 'gifski' folder.")
             self.test_btn.config(state=DISABLED)
@@ -550,12 +744,10 @@ class MainWindow:
                                  "Please install FFmpeg and add it to your system PATH.")
 
         # Update status
-        mode_names = {
-            "mode1": "Mode 1: Video → GIF",
-            "mode2": "Mode 2: Images → GIF",
-            "mode3": "Mode 3: Optimize GIF"
-        }
-        self._update_status(f"{mode_names[mode]} selected")
+        self._update_status(f"{_MODE_NAMES[mode]} selected")
+
+        # Show/hide mode-specific controls
+        self._update_mode_widgets(mode)
 
         # Update file count display based on new mode
         self._update_file_count()
@@ -627,21 +819,97 @@ class MainWindow:
             self.output_folder.set(last_output)
 
     def _save_settings(self):
-        """Save current settings to config file."""
-        settings = self._get_current_settings()
-        self.config.save(settings)
+        """Queue current settings for saving on the background thread."""
+        self._save_queue.put_nowait(self._get_current_settings())
 
-    def _update_value_labels(self):
-        """Update all slider value labels to match their IntVar values."""
-        if hasattr(self, '_value_labels'):
-            for var, label in self._value_labels:
-                label.config(text=str(var.get()))
+    def _save_worker(self):
+        """Background loop that writes queued settings to disk.
+
+        Bursts coalesce: if more settings dicts arrived while a write
+        was in flight, only the newest one is written.
+        """
+        while True:
+            settings = self._save_queue.get()
+            try:
+                while True:
+                    settings = self._save_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.config.save(settings)
+            except Exception as e:
+                log_info(f"Error saving settings: {e}")
+
+    def _snap_and_save(self, variable, from_, to, increment):
+        """Snap a slider's value to its increment and persist settings.
+
+        Bound to <ButtonRelease-1> on each slider, so the snap and the
+        (debounced) save run once per drag rather than on every motion
+        event; the value label tracks the raw value live via its trace.
+        """
+        value = variable.get()
+        # Pure integer snap to multiples of the increment (anchored at
+        # 0, matching the old round(value / increment) * increment
+        # behavior so defaults like 70/80 stay reachable by dragging),
+        # then clamp into the slider's range
+        snapped = ((value + increment // 2) // increment) * increment
+        snapped = max(from_, min(to, snapped))
+        if snapped != value:
+            variable.set(snapped)
+        self._schedule_save()
+
+    def _schedule_save(self):
+        """Schedule a debounced settings save on the Tk event loop.
+
+        Rapid-fire changes (e.g. dragging a slider) collapse into a
+        single disk write 250ms after the last change, instead of one
+        synchronous write per event on the main thread.
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(250, self._flush_save)
+
+    def _flush_save(self):
+        """Run the pending debounced save."""
+        self._save_after_id = None
+        self._save_settings()
+
+    def _update_value_labels(self, variables=None):
+        """Update slider value labels to match their IntVar values.
+
+        Args:
+            variables: Optional iterable of variables to restrict the
+                update to; by default every slider label is refreshed
+        """
+        if variables is None:
+            entries = self._value_labels.values()
+        else:
+            # Look up by Tcl name - the dict key _create_slider uses
+            entries = [entry for entry in
+                       (self._value_labels.get(str(v)) for v in variables)
+                       if entry is not None]
+        for var, label in entries:
+            label.config(text=str(var.get()))
 
     def _reset_to_defaults(self):
         """Reset all settings to default values."""
+        # Drop any pending pre-reset saves first: cancel the debounced
+        # flush and discard queued snapshots, so the save worker can't
+        # land stale settings on disk after the reset
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        try:
+            while True:
+                self._save_queue.get_nowait()
+        except queue.Empty:
+            pass
+
         defaults = self.config.reset_to_defaults()
 
-        # Update all IntVar values
+        # Update all IntVar values. Each set() refreshes its own value
+        # label via the variable's trace, so no bulk label pass is
+        # needed afterwards.
         self.quality.set(defaults['quality'])
         self.width.set(defaults['width'])
         self.height.set(defaults['height'])
@@ -649,8 +917,10 @@ class MainWindow:
         self.lossy_quality.set(defaults['lossy_quality'])
         self.motion_quality.set(defaults['motion_quality'])
 
-        # Update all value labels to match
-        self._update_value_labels()
+        # Enqueue the post-reset state through the normal save path so
+        # the last write is always the defaults even if the worker was
+        # mid-write when the reset happened (a no-op if already current)
+        self._save_settings()
 
         self._update_status("Settings reset to defaults")
 
@@ -679,8 +949,7 @@ class MainWindow:
             self._show_error("Please select an output folder")
             return False
 
-        input_path = Path(self.input_folder.get())
-        if not input_path.exists():
+        if not self._folder_exists(self.input_folder.get()):
             self._show_error("Input folder does not exist")
             return False
 
@@ -698,6 +967,22 @@ class MainWindow:
 
         return True
 
+    def _folder_exists(self, path_str):
+        """Check folder existence with a short TTL cache.
+
+        Repeated Test/Process clicks re-stat the input folder on the UI
+        thread; on network drives that stat can stall for seconds. A
+        2-second cache keeps repeat clicks instant while still noticing
+        a folder that disappears.
+        """
+        now = time.monotonic()
+        cached = self._exists_cache.get(path_str)
+        if cached is not None and now - cached[0] < 2.0:
+            return cached[1]
+        exists = Path(path_str).exists()
+        self._exists_cache[path_str] = (now, exists)
+        return exists
+
     def _on_generate_test(self):
         """Handle 'Generate Test File' button click."""
         if not self._validate_inputs():
@@ -828,7 +1113,17 @@ class MainWindow:
         self._update_status("Cancelling...")
 
     def _on_progress(self, current, total, message):
-        """Callback for progress updates from batch processor."""
+        """Callback for progress updates from batch processor.
+
+        Rate-limited to ~30Hz: each update schedules a root.after
+        callback, and a fast batch can report far quicker than Tk can
+        render, growing the event queue into visible lag. The final
+        update (current == total) always goes through.
+        """
+        now = time.monotonic()
+        if current < total and now - self._last_progress_ts < 0.033:
+            return
+        self._last_progress_ts = now
         progress = (current / total * 100) if total > 0 else 0
         self._update_progress_threadsafe(progress, message)
 
@@ -839,52 +1134,80 @@ class MainWindow:
 
     def _update_status(self, message):
         """Update status label."""
+        self._current_status = message
         self.status_label.config(text=message)
 
     def _update_status_threadsafe(self, message):
-        """Update status label from background thread."""
-        self.root.after(0, lambda: self._update_status(message))
+        """Update status label from background thread.
+
+        Duplicate messages are dropped before scheduling - workers can
+        repeat the same status many times, and each after(0) costs a
+        Tk queue entry plus a label reconfigure. The shadow copy in
+        _current_status avoids a cross-thread cget call.
+        """
+        if message == self._current_status:
+            return
+        self._current_status = message
+        self.root.after(0, lambda: self.status_label.config(text=message))
 
     def _update_file_count(self):
-        """Update file count label to show all file types found in input folder."""
+        """Refresh the file count label by scanning the input folder.
+
+        The scan itself runs on a background thread - Path walks can
+        block for seconds on HDD/NAS folders, and doing that on the Tk
+        thread freezes the whole window. Results are marshalled back
+        with root.after; a request id lets the newest selection win if
+        an older, slower scan finishes late.
+        """
         # Don't update during processing to avoid confusion
         if self.is_processing:
             return
 
         input_folder_path = self.input_folder.get()
-        if not input_folder_path:
+        if not input_folder_path or not Path(input_folder_path).exists():
             self.file_count_label.config(text="Found: 0 videos, 0 images, 0 gifs")
             return
 
-        input_path = Path(input_folder_path)
-        if not input_path.exists():
-            self.file_count_label.config(text="Found: 0 videos, 0 images, 0 gifs")
-            return
+        self._scan_request_id += 1
+        threading.Thread(
+            target=self._scan_worker,
+            args=(Path(input_folder_path), self._scan_request_id),
+            daemon=True
+        ).start()
 
+    def _scan_worker(self, input_path, request_id):
+        """Scan the input folder off the Tk thread and report counts back."""
         try:
-            # Scan for all file types
             all_files = scan_all_file_types(input_path)
-            video_count = len(all_files['videos'])
-            image_count = len(all_files['images'])
-            gif_count = len(all_files['gifs'])
-
-            # Update label
-            self.file_count_label.config(
-                text=f"Found: {video_count} videos, {image_count} images, {gif_count} gifs"
-            )
-
-            # Only log if this is a manual folder selection (not post-processing update)
-            if not hasattr(self, '_last_logged_count') or self._last_logged_count != (video_count, image_count, gif_count):
-                log_info(f"Input folder selected: {input_folder_path} - "
-                        f"Found {video_count} videos, {image_count} images, {gif_count} gifs")
-                self._last_logged_count = (video_count, image_count, gif_count)
-
+            counts = (len(all_files['videos']),
+                      len(all_files['images']),
+                      len(all_files['gifs']))
         except Exception as e:
             log_info(f"Error scanning input folder: {e}")
-            self.file_count_label.config(text="Found: 0 videos, 0 images, 0 gifs")
+            counts = (0, 0, 0)
+        self.root.after(0, lambda: self._apply_file_count(
+            str(input_path), counts, request_id))
+
+    def _apply_file_count(self, input_folder_path, counts, request_id):
+        """Show scan results in the file count label (runs on Tk thread)."""
+        if request_id != self._scan_request_id:
+            return  # a newer folder was selected while this scan ran
+
+        video_count, image_count, gif_count = counts
+        self.file_count_label.config(
+            text=f"Found: {video_count} videos, {image_count} images, {gif_count} gifs"
+        )
+
+        # Only log if this is a manual folder selection (not post-processing update)
+        if not hasattr(self, '_last_logged_count') or self._last_logged_count != counts:
+            log_info(f"Input folder selected: {input_folder_path} - "
+                    f"Found {video_count} videos, {image_count} images, {gif_count} gifs")
+            self._last_logged_count = counts
 
     def _update_progress_threadsafe(self, progress, message):
         """Update progress bar and status from background thread."""
+        self._current_status = message
+
         def update():
             self.progress_bar['value'] = progress
             self.status_label.config(text=message)
@@ -895,6 +1218,9 @@ class MainWindow:
         """Enable/disable buttons and control activity indicator based on processing state."""
         self.is_processing = is_processing
 
+        # Processing creates files, so any cached folder scan is stale
+        invalidate_scan_cache()
+
         if is_processing:
             self.test_btn.config(state=DISABLED)
             self.process_btn.config(state=DISABLED)
@@ -916,7 +1242,6 @@ class MainWindow:
 
     def _show_error(self, message):
         """Show error message dialog."""
-        from tkinter import messagebox
         messagebox.showerror("Error", message)
 
     def _show_error_threadsafe(self, message):
@@ -925,17 +1250,25 @@ class MainWindow:
 
     def _show_warning(self, message):
         """Show warning message dialog."""
-        from tkinter import messagebox
         messagebox.showwarning("Warning", message)
 
+    @functools.cached_property
+    def _readme_path(self):
+        """Resolved readme.md path, or None if it doesn't exist.
+
+        Resolution and the exists() stat run once on the first Help
+        press - the bundled files can't change mid-session.
+        """
+        path = get_resource_path('readme.md')
+        return path if path.exists() else None
+
     def _on_help(self):
         """Handle Help button click - opens readme.md."""
-        readme_path = get_resource_path('readme.md')
-        if readme_path.exists():
+        readme_path = self._readme_path
+        if readme_path is not None:
             try:
                 # Open readme.md with default text editor
                 if platform.system() == 'Windows':
-                    import os
                     os.startfile(str(readme_path))
                 else:
                     webbrowser.open(str(readme_path))
@@ -38,115 +38,117 @@ def get_custom_theme():
     }
 
 
+# All custom widget styles as plain data. Applied in one Tcl script by
+# apply_custom_styles - each individual style.configure() call is a
+# Python<->Tcl round-trip, and ~20 of them add noticeable startup
+# latency on Windows.
+_CUSTOM_STYLES = (
+    # Frame backgrounds
+    ('TFrame', {'background': '#0d0d0d'}),
+    ('Dark.TFrame', {'background': '#000000'}),
+
+    # Thin divider strips (used instead of ttk.Separator, whose tiled
+    # 1px image makes window resizes noticeably laggy)
+    ('Divider.TFrame', {'background': '#444444'}),
+
+    # Labels
+    ('TLabel', {'background': '#0d0d0d',
+                'foreground': '#ffffff',
+                'font': ('Segoe UI', 10)}),
+    ('Title.TLabel', {'background': '#0d0d0d',
+                      'foreground': '#FFD700',  # Yellow title
+                      'font': ('Segoe UI', 18, 'bold')}),
+    ('Subtitle.TLabel', {'background': '#0d0d0d',
+                         'foreground': '#FF8C00',  # Orange subtitle
+                         'font': ('Segoe UI', 11)}),
+    ('Header.TLabel', {'background': '#0d0d0d',
+                       'foreground': '#FFD700',  # Yellow headers
+                       'font': ('Segoe UI', 12, 'bold')}),
+
+    # Buttons
+    ('Primary.TButton', {'background': '#FFD700',  # Yellow
+                         'foreground': '#000000',
+                         'borderwidth': 0,
+                         'font': ('Segoe UI', 10, 'bold')}),
+    ('Secondary.TButton', {'background': '#FF8C00',  # Orange
+                           'foreground': '#000000',
+                           'borderwidth': 0,
+                           'font': ('Segoe UI', 10, 'bold')}),
+    ('Danger.TButton', {'background': '#FF4444',  # Red
+                        'foreground': '#ffffff',
+                        'borderwidth': 0,
+                        'font': ('Segoe UI', 10, 'bold')}),
+    ('Violet.TButton', {'background': '#9C27B0',  # Violet
+                        'foreground': '#ffffff',
+                        'borderwidth': 0,
+                        'font': ('Segoe UI', 10, 'bold')}),
+    ('Large.Violet.TButton', {'background': '#9C27B0',  # Violet
+                              'foreground': '#ffffff',
+                              'borderwidth': 0,
+                              'font': ('Segoe UI', 12, 'bold')}),
+
+    # Entries
+    ('TEntry', {'fieldbackground': '#1a1a1a',
+                'foreground': '#ffffff',
+                'borderwidth': 1,
+                'relief': 'solid'}),
+
+    # Radiobuttons / checkbuttons
+    ('TRadiobutton', {'background': '#0d0d0d',
+                      'foreground': '#ffffff',
+                      'font': ('Segoe UI', 10)}),
+    ('TCheckbutton', {'background': '#0d0d0d',
+                      'foreground': '#ffffff',
+                      'font': ('Segoe UI', 10)}),
+
+    # Progressbar and sliders (violet)
+    ('Violet.Horizontal.TProgressbar', {'background': '#9C27B0',
+                                        'troughcolor': '#1a1a1a',
+                                        'borderwidth': 0,
+                                        'thickness': 20}),
+    ('Violet.Horizontal.TScale', {'background': '#0d0d0d',
+                                  'troughcolor': '#1a1a1a',
+                                  'sliderthickness': 20,
+                                  'sliderrelief': 'flat'}),
+
+    # Labelframes
+    ('TLabelframe', {'background': '#0d0d0d',
+                     'foreground': '#FFD700',  # Yellow labels
+                     'borderwidth': 2,
+                     'relief': 'solid'}),
+    ('TLabelframe.Label', {'background': '#0d0d0d',
+                           'foreground': '#FFD700',
+                           'font': ('Segoe UI', 10, 'bold')}),
+)
+
+
+def _tcl_value(value):
+    """Format a Python option value as a Tcl word (braced if needed)."""
+    if isinstance(value, tuple):
+        # Font specs: ('Segoe UI', 10, 'bold') -> {{Segoe UI} 10 bold}
+        return '{' + ' '.join(_tcl_value(v) for v in value) + '}'
+    text = str(value)
+    return '{' + text + '}' if ' ' in text else text
+
+
 def apply_custom_styles(root):
     """
     Apply custom styles to ttk widgets.
 
+    All styles are applied with a single Tcl script instead of one
+    style.configure() round-trip per style.
+
     Args:
         root: The root tkinter window
     """
-    style = ttk.Style()
-
-    # Configure frame backgrounds
-    style.configure('TFrame', background='#0d0d0d')
-    style.configure('Dark.TFrame', background='#000000')
-
-    # Configure labels
-    style.configure('TLabel',
-                   background='#0d0d0d',
-                   foreground='#ffffff',
-                   font=('Segoe UI', 10))
-
-    style.configure('Title.TLabel',
-                   background='#0d0d0d',
-                   foreground='#FFD700',  # Yellow title
-                   font=('Segoe UI', 18, 'bold'))
-
-    style.configure('Subtitle.TLabel',
-                   background='#0d0d0d',
-                   foreground='#FF8C00',  # Orange subtitle
-                   font=('Segoe UI', 11))
-
-    style.configure('Header.TLabel',
-                   background='#0d0d0d',
-                   foreground='#FFD700',  # Yellow headers
-                   font=('Segoe UI', 12, 'bold'))
-
-    # Configure buttons
-    style.configure('Primary.TButton',
-                   background='#FFD700',  # Yellow
-                   foreground='#000000',
-                   borderwidth=0,
-                   font=('Segoe UI', 10, 'bold'))
-
-    style.configure('Secondary.TButton',
-                   background='#FF8C00',  # Orange
-                   foreground='#000000',
-                   borderwidth=0,
-                   font=('Segoe UI', 10, 'bold'))
-
-    style.configure('Danger.TButton',
-                   background='#FF4444',  # Red
-                   foreground='#ffffff',
-                   borderwidth=0,
-                   font=('Segoe UI', 10, 'bold'))
-
-    style.configure('Violet.TButton',
-                   background='#9C27B0',  # Violet
-                   foreground='#ffffff',
-                   borderwidth=0,
-                   font=('Segoe UI', 10, 'bold'))
-
-    style.configure('Large.Violet.TButton',
-                   background='#9C27B0',  # Violet
-                   foreground='#ffffff',
-                   borderwidth=0,
-                   font=('Segoe UI', 12, 'bold'))  # Larger and bold
-
-    # Configure entries
-    style.configure('TEntry',
-                   fieldbackground='#1a1a1a',
-                   foreground='#ffffff',
-                   borderwidth=1,
-                   relief='solid')
-
-    # Configure radiobuttons
-    style.configure('TRadiobutton',
-                   background='#0d0d0d',
-                   foreground='#ffffff',
-                   font=('Segoe UI', 10))
-
-    # Configure checkbuttons
-    style.configure('TCheckbutton',
-                   background='#0d0d0d',
-                   foreground='#ffffff',
-                   font=('Segoe UI', 10))
-
-    # Configure progressbar (violet)
-    style.configure('Violet.Horizontal.TProgressbar',
-                   background='#9C27B0',
-                   troughcolor='#1a1a1a',
-                   borderwidth=0,
-                   thickness=20)
-
-    # Configure scales/sliders (violet)
-    style.configure('Violet.Horizontal.TScale',
-                   background='#0d0d0d',
-                   troughcolor='#1a1a1a',
-                   sliderthickness=20,
-                   sliderrelief='flat')
-
-    # Configure labelframes
-    style.configure('TLabelframe',
-                   background='#0d0d0d',
-                   foreground='#FFD700',  # Yellow labels
-                   borderwidth=2,
-                   relief='solid')
-
-    style.configure('TLabelframe.Label',
-                   background='#0d0d0d',
-                   foreground='#FFD700',
-                   font=('Segoe UI', 10, 'bold'))
+    script = '\n'.join(
+        'ttk::style configure {} {}'.format(
+            name,
+            ' '.join(f'-{opt} {_tcl_value(val)}'
+                     for opt, val in options.items()))
+        for name, options in _CUSTOM_STYLES
+    )
+    root.tk.eval(script)
 
 
 def setup_theme(root):
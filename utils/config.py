@@ -4,10 +4,42 @@ Handles saving and loading user settings.
 """
 
 import json
+import os
 import sys
+import threading
 from pathlib import Path
 from typing import Dict, Any
 
+# Optional C-accelerated JSON - a wash for today's ~10-key config but
+# free headroom if settings ever grow (history, recent folders). The
+# app works identically without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(settings: Dict[str, Any]) -> str:
+    """Serialize settings to indented JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(settings, indent=2)
+
+
+def _loads(text: str) -> Dict[str, Any]:
+    """Parse a JSON settings document, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# Application directory, resolved once at import. Frozen (PyInstaller)
+# builds live next to the exe; in development the repo root is two
+# levels up from this file.
+if getattr(sys, 'frozen', False):
+    _APP_DIR = Path(sys.executable).parent
+else:
+    _APP_DIR = Path(__file__).parent.parent
+
 
 class Config:
     """Manages application configuration."""
@@ -32,17 +64,18 @@ class Config:
         """
         if config_path is None:
             # Store config in same directory as application
-            if getattr(sys, 'frozen', False):
-                # Running as PyInstaller exe - use directory where exe is located
-                app_dir = Path(sys.executable).parent
-            else:
-                # Running in development mode - files are in root
-                app_dir = Path(__file__).parent.parent
-            self.config_path = app_dir / 'config.json'
+            self.config_path = _APP_DIR / 'config.json'
         else:
             self.config_path = Path(config_path)
 
         self.settings = self.DEFAULT_SETTINGS.copy()
+        # Serialized form of the last successful save/load - lets save()
+        # skip disk entirely when nothing actually changed
+        self._serialized = None
+        # save() can be called from the Tk thread (reset) and the GUI's
+        # background save worker; serialize writers so the temp file and
+        # _serialized never see interleaved updates
+        self._save_lock = threading.Lock()
         self.load()
 
     def load(self) -> Dict[str, Any]:
@@ -54,9 +87,10 @@ class Config:
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as f:
-                    loaded_settings = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    self.settings = {**self.DEFAULT_SETTINGS, **loaded_settings}
+                    loaded_settings = _loads(f.read())
+                # Merge with defaults to ensure all keys exist
+                self.settings = {**self.DEFAULT_SETTINGS, **loaded_settings}
+                self._serialized = _dumps(self.settings)
             else:
                 # Use defaults if no config file exists, and create the file
                 self.settings = self.DEFAULT_SETTINGS.copy()
@@ -70,6 +104,10 @@ class Config:
     def save(self, settings: Dict[str, Any]) -> bool:
         """Save settings to config file.
 
+        Skips the write entirely when the settings are identical to the
+        last save/load, and writes atomically (temp file + os.replace)
+        so a crash mid-write can never leave a truncated config.json.
+
         Args:
             settings: Dictionary of settings to save
 
@@ -77,10 +115,18 @@ class Config:
             True if successful, False otherwise
         """
         try:
-            self.settings = settings
-            with open(self.config_path, 'w') as f:
-                json.dump(settings, f, indent=2)
-            return True
+            with self._save_lock:
+                self.settings = settings
+                serialized = _dumps(settings)
+                if serialized == self._serialized:
+                    return True  # nothing changed - no disk I/O needed
+
+                tmp_path = self.config_path.with_suffix('.json.tmp')
+                with open(tmp_path, 'w') as f:
+                    f.write(serialized)
+                os.replace(tmp_path, self.config_path)
+                self._serialized = serialized
+                return True
         except Exception as e:
             print(f"Warning: Could not save config to {self.config_path}: {e}")
             return False
@@ -1,36 +1,97 @@
 """File operation utilities."""
 
+import os
 import re
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
 
 # Supported file extensions
-VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
-IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp'}
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp'})
 GIF_EXTENSION = '.gif'
 
+# Flat extension -> bucket dispatch for the scan loop: one dict lookup
+# per file instead of up to three set-membership tests
+_EXT_TO_BUCKET = {
+    **{ext: 'videos' for ext in VIDEO_EXTENSIONS},
+    **{ext: 'images' for ext in IMAGE_EXTENSIONS},
+    GIF_EXTENSION: 'gifs',
+}
+
+# Compiled once at import - natural_sort_key runs once per file on
+# every sorted scan, so even re's internal pattern-cache lookup adds up
+_NAT_SORT_RE = re.compile(r'(\d+)')
+# Numbering patterns stripped by group_images_by_name, as one
+# alternation so grouping costs a single regex op per file:
+# _001, (1), -0001, and bare trailing numbers like "frame 12"
+_GROUP_NUM_RE = re.compile(r'(?:[_\-\s]\(?\d+\)?|\s+\d+)$')
+
+
+# Scan results keyed by folder path -> (mtime_ns, buckets). Adding or
+# removing a file bumps the directory's mtime, so an unchanged mtime
+# means the previous walk is still valid - repeated scans of the same
+# folder (file count refresh, batch start) return instantly even on
+# network drives. Small and session-scoped, so a handful of entries is
+# plenty.
+_scan_cache: Dict[str, tuple] = {}
+_SCAN_CACHE_MAX = 8
+
+
+def invalidate_scan_cache():
+    """Forget all cached folder scans.
+
+    Call when files may have been created without going through this
+    module (e.g. after a processing run writes GIFs).
+    """
+    _scan_cache.clear()
+
+
+def scan_media(folder: Path) -> Dict[str, List[Path]]:
+    """Classify all supported files in a folder in one directory pass.
 
-def scan_folder_for_files(folder: Path, extensions: set) -> List[Path]:
-    """Scan folder for files with specific extensions.
+    A single os.scandir walk dispatches each entry into the video/image/
+    gif bucket by lowercase suffix - O(dir) syscalls instead of one glob
+    per extension (and case-insensitive matching for free). All buckets
+    are naturally sorted. Results are cached per folder and reused until
+    the folder's mtime changes.
 
     Args:
         folder: Folder to scan
-        extensions: Set of file extensions (e.g., {'.mp4', '.avi'})
 
     Returns:
-        List of file paths sorted naturally
+        Dictionary with keys 'videos', 'images', 'gifs' mapping to file lists
     """
-    files = []
-    for ext in extensions:
-        files.extend(folder.glob(f'*{ext}'))
-        # Also check uppercase extensions
-        files.extend(folder.glob(f'*{ext.upper()}'))
-
-    # Remove duplicates (case-insensitive filesystems may return same file twice)
-    unique_files = list(dict.fromkeys(files))
-
-    return sorted(unique_files, key=lambda p: natural_sort_key(p.name))
+    key = str(folder)
+    mtime_ns = os.stat(folder).st_mtime_ns
+    cached = _scan_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    buckets = {'videos': [], 'images': [], 'gifs': []}
+
+    # The walk and sort work on raw (name, path) strings; Path objects
+    # are only built for the survivors after sorting, since every Path
+    # construction pays argument parsing and flavour dispatch
+    with os.scandir(folder) as it:
+        for e in it:
+            if not e.is_file(follow_symlinks=False):
+                continue
+            bucket = _EXT_TO_BUCKET.get(os.path.splitext(e.name)[1].lower())
+            if bucket is not None:
+                buckets[bucket].append((e.name, e.path))
+
+    result = {}
+    for bucket, entries in buckets.items():
+        entries.sort(key=lambda t: natural_sort_key(t[0]))
+        result[bucket] = [Path(path) for _, path in entries]
+
+    if len(_scan_cache) >= _SCAN_CACHE_MAX:
+        _scan_cache.clear()
+    _scan_cache[key] = (mtime_ns, result)
+    return result
 
 
 def scan_for_videos(folder: Path) -> List[Path]:
@@ -43,7 +104,7 @@ def scan_for_videos(folder: Path) -> List[Path]:
         List of video file paths (GIFs not included)
     """
     # VIDEO_EXTENSIONS already excludes .gif
-    return scan_folder_for_files(folder, VIDEO_EXTENSIONS)
+    return scan_media(folder)['videos']
 
 
 def scan_for_images(folder: Path) -> List[Path]:
@@ -55,7 +116,7 @@ def scan_for_images(folder: Path) -> List[Path]:
     Returns:
         List of image file paths
     """
-    return scan_folder_for_files(folder, IMAGE_EXTENSIONS)
+    return scan_media(folder)['images']
 
 
 def scan_for_gifs(folder: Path) -> List[Path]:
@@ -67,7 +128,32 @@ def scan_for_gifs(folder: Path) -> List[Path]:
     Returns:
         List of GIF file paths
     """
-    return scan_folder_for_files(folder, {GIF_EXTENSION})
+    return scan_media(folder)['gifs']
+
+
+def scan_for_gifs_with_sizes(folder: Path) -> List[tuple]:
+    """Scan folder for GIF files, returning sizes from the same pass.
+
+    DirEntry.stat() reuses the metadata the directory walk already
+    fetched (free on Windows), so callers that need input sizes - Mode 3
+    statistics - avoid a second stat() per file later.
+
+    Args:
+        folder: Folder to scan
+
+    Returns:
+        List of (path, size_bytes) tuples, naturally sorted by name
+    """
+    entries = []
+    with os.scandir(folder) as it:
+        for e in it:
+            if (e.is_file(follow_symlinks=False)
+                    and os.path.splitext(e.name)[1].lower() == GIF_EXTENSION):
+                entries.append((e.name, e.path, e.stat().st_size))
+
+    # Sort on raw names, then build Paths only for the survivors
+    entries.sort(key=lambda t: natural_sort_key(t[0]))
+    return [(Path(path), size) for _, path, size in entries]
 
 
 def scan_all_file_types(folder: Path) -> Dict[str, List[Path]]:
@@ -79,25 +165,27 @@ def scan_all_file_types(folder: Path) -> Dict[str, List[Path]]:
     Returns:
         Dictionary with keys 'videos', 'images', 'gifs' mapping to file lists
     """
-    return {
-        'videos': scan_for_videos(folder),
-        'images': scan_for_images(folder),
-        'gifs': scan_for_gifs(folder)
-    }
+    return scan_media(folder)
 
 
-def natural_sort_key(s: str) -> list:
+@lru_cache(maxsize=4096)
+def natural_sort_key(s: str) -> tuple:
     """Generate natural sorting key for strings.
 
-    Sorts strings naturally (1, 2, 10 not 1, 10, 2).
+    Sorts strings naturally (1, 2, 10 not 1, 10, 2). Memoized - the
+    same filenames get keyed repeatedly across scans (file count
+    refresh, batch scan, per-group re-sort in Mode 2), so cache hits
+    skip the regex split entirely. Returns a tuple so the cached value
+    is immutable.
 
     Args:
         s: String to generate key for
 
     Returns:
-        List of components for natural sorting
+        Tuple of components for natural sorting
     """
-    return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', s)]
+    return tuple(int(c) if c.isdigit() else c.lower()
+                 for c in _NAT_SORT_RE.split(s))
 
 
 def group_images_by_name(image_files: List[Path]) -> Dict[str, List[Path]]:
@@ -114,27 +202,18 @@ def group_images_by_name(image_files: List[Path]) -> Dict[str, List[Path]]:
     Returns:
         Dictionary mapping base names to lists of file paths
     """
-    groups = {}
+    groups = defaultdict(list)
 
     for img_path in image_files:
-        # Extract base name (remove numbering patterns)
-        # Patterns: _001, (1), _0001, -001, etc.
-        base_name = re.sub(r'[_\-\s]\(?(\d+)\)?$', '', img_path.stem)
-
-        # If no pattern matched, use the full stem as base name
-        if base_name == img_path.stem:
-            # Check for space followed by number
-            base_name = re.sub(r'\s+\d+$', '', img_path.stem)
-
-        if base_name not in groups:
-            groups[base_name] = []
-        groups[base_name].append(img_path)
+        # Strip the numbering pattern (single alternation, one regex op
+        # per file); files with no pattern keep their full stem
+        groups[_GROUP_NUM_RE.sub('', img_path.stem)].append(img_path)
 
     # Natural sort within each group
     for base_name in groups:
         groups[base_name].sort(key=lambda p: natural_sort_key(p.name))
 
-    return groups
+    return dict(groups)
 
 
 def ensure_temp_folder(output_folder: Path) -> Path:
@@ -154,16 +233,23 @@ def ensure_temp_folder(output_folder: Path) -> Path:
 def cleanup_temp_folder(temp_folder: Path):
     """Clean up all files in temp folder.
 
+    Uses os.scandir so the file-type check reads the cached dirent
+    type instead of stat'ing each entry - temp folders can hold
+    thousands of extracted video frames.
+
     Args:
         temp_folder: Temp folder to clean
     """
-    if temp_folder.exists() and temp_folder.is_dir():
-        for file in temp_folder.iterdir():
-            if file.is_file():
-                try:
-                    file.unlink()
-                except Exception:
-                    pass  # Ignore cleanup errors
+    try:
+        with os.scandir(temp_folder) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass  # Ignore cleanup errors
+    except OSError:
+        pass  # Folder missing or unreadable - nothing to clean
 
 
 def get_file_size_mb(file_path: Path) -> float:
@@ -173,11 +259,14 @@ def get_file_size_mb(file_path: Path) -> float:
         file_path: Path to file
 
     Returns:
-        File size in MB
+        File size in MB (0.0 if the file doesn't exist)
     """
-    if file_path.exists():
+    # Single stat - a separate exists() check would double the syscalls
+    # for the common case where the file is there
+    try:
         return file_path.stat().st_size / (1024 * 1024)
-    return 0.0
+    except OSError:
+        return 0.0
 
 
 def format_file_size(size_bytes: int) -> str:
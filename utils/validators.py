@@ -109,6 +109,17 @@ def validate_folders(input_folder: str, output_folder: str) -> tuple[bool, str]:
     return True, ""
 
 
+# (key, default, validator, error prefix) rows driving validate_settings
+_SETTING_CHECKS = (
+    ('quality', 70, validate_quality, ""),
+    ('width', 0, validate_dimension, "Width error: "),
+    ('height', 0, validate_dimension, "Height error: "),
+    ('fps', 15, validate_fps, ""),
+    ('lossy_quality', 80, validate_quality, "Lossy quality error: "),
+    ('motion_quality', 80, validate_quality, "Motion quality error: "),
+)
+
+
 def validate_settings(settings: dict) -> tuple[bool, str]:
     """Validate all gifski settings.
 
@@ -118,34 +129,9 @@ def validate_settings(settings: dict) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Validate quality
-    valid, error = validate_quality(settings.get('quality', 70))
-    if not valid:
-        return False, error
-
-    # Validate width
-    valid, error = validate_dimension(settings.get('width', 0))
-    if not valid:
-        return False, f"Width error: {error}"
-
-    # Validate height
-    valid, error = validate_dimension(settings.get('height', 0))
-    if not valid:
-        return False, f"Height error: {error}"
-
-    # Validate FPS
-    valid, error = validate_fps(settings.get('fps', 15))
-    if not valid:
-        return False, error
-
-    # Validate lossy quality
-    valid, error = validate_quality(settings.get('lossy_quality', 80))
-    if not valid:
-        return False, f"Lossy quality error: {error}"
-
-    # Validate motion quality
-    valid, error = validate_quality(settings.get('motion_quality', 80))
-    if not valid:
-        return False, f"Motion quality error: {error}"
-
+    get = settings.get  # bind once instead of six attribute lookups
+    for key, default, validator, prefix in _SETTING_CHECKS:
+        valid, error = validator(get(key, default))
+        if not valid:
+            return False, prefix + error
     return True, ""